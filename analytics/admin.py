@@ -0,0 +1,10 @@
+from django.contrib import admin
+from .models import MarketDailyStat
+
+
+@admin.register(MarketDailyStat)
+class MarketDailyStatAdmin(admin.ModelAdmin):
+    list_display = ('day', 'trade', 'region', 'offers_created', 'open_offers_delta', 'inquiries_created', 'inquiries_accepted')
+    list_filter = ('trade',)
+    date_hierarchy = 'day'
+    show_full_result_count = False
@@ -0,0 +1,58 @@
+from collections import defaultdict
+from itertools import chain
+
+from django.db import transaction
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from analytics.models import MarketDailyStat
+from analytics.rollups import inquiry_events, offer_events, region_of
+from archive.models import ArchivedInquiry
+from jobs.models import Offer, Inquiry
+
+
+class Command(BaseCommand):
+    help = (
+        "Berechnet die täglichen Marktkennzahlen aus Offer/Inquiry (inkl. archivierter Anfragen) neu. "
+        "Annahme- und Abschlusszeitpunkte werden aus updated_at abgeleitet; "
+        "es gelten dieselben Buchungsregeln wie inkrementell (analytics.rollups)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        totals = defaultdict(lambda: defaultdict(int))
+
+        def add(offer, events):
+            for moment, deltas in events:
+                key = (timezone.localdate(moment), offer.trade.strip(), region_of(offer.zip_code))
+                for name, value in deltas.items():
+                    totals[key][name] += value
+
+        accepted_at = {}
+        for model in (ArchivedInquiry, Inquiry):
+            accepted_at.update(
+                model.objects.filter(status=Inquiry.ApplicationStatus.ACCEPTED).values_list('offer_id', 'updated_at')
+            )
+        offers = Offer.objects.only('trade', 'zip_code', 'status', 'created_at', 'updated_at')
+        for offer in offers.iterator(chunk_size=options['batch_size']):
+            add(offer, offer_events(offer, accepted_at.get(offer.pk)))
+
+        inquiries = [
+            model.objects.select_related('offer').only(
+                'status', 'created_at', 'updated_at', 'offer__trade', 'offer__zip_code', 'offer__created_at',
+            ).iterator(chunk_size=options['batch_size'])
+            for model in (Inquiry, ArchivedInquiry)
+        ]
+        for inquiry in chain(*inquiries):
+            add(inquiry.offer, inquiry_events(inquiry, inquiry.offer))
+
+        rows = [
+            MarketDailyStat(day=day, trade=trade, region=region, **counters)
+            for (day, trade, region), counters in totals.items()
+        ]
+        with transaction.atomic():
+            MarketDailyStat.objects.all().delete()
+            MarketDailyStat.objects.bulk_create(rows, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"{len(rows)} Tageswerte neu berechnet."))
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MarketDailyStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='Tag')),
+                ('trade', models.CharField(max_length=100, verbose_name='Gewerbe')),
+                ('region', models.CharField(max_length=10, verbose_name='PLZ-Region')),
+                ('offers_created', models.PositiveIntegerField(default=0)),
+                ('offers_accepted', models.PositiveIntegerField(default=0)),
+                ('offers_completed', models.PositiveIntegerField(default=0)),
+                ('open_offers_delta', models.IntegerField(default=0)),
+                ('inquiries_created', models.PositiveIntegerField(default=0)),
+                ('inquiries_accepted', models.PositiveIntegerField(default=0)),
+                ('inquiries_rejected', models.PositiveIntegerField(default=0)),
+                ('time_to_accept_seconds', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'ordering': ['day'],
+                'indexes': [models.Index(fields=['trade', 'region', 'day'], name='analytics_m_trade_328766_idx')],
+                'constraints': [models.UniqueConstraint(fields=('day', 'trade', 'region'), name='unique_market_daily_stat')],
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+from django.db import models
+
+
+class MarketDailyStat(models.Model):
+    """
+    Daily supply/demand aggregates per (trade, PLZ region).
+    Counters are incremented from offer and inquiry status transitions
+    (analytics.signals); `open_offers_delta` summed over time gives the
+    number of open offers.
+    """
+    day = models.DateField(verbose_name="Tag")
+    trade = models.CharField(max_length=100, verbose_name="Gewerbe")
+    region = models.CharField(max_length=10, verbose_name="PLZ-Region")
+    offers_created = models.PositiveIntegerField(default=0)
+    offers_accepted = models.PositiveIntegerField(default=0)
+    offers_completed = models.PositiveIntegerField(default=0)
+    open_offers_delta = models.IntegerField(default=0)
+    inquiries_created = models.PositiveIntegerField(default=0)
+    inquiries_accepted = models.PositiveIntegerField(default=0)
+    inquiries_rejected = models.PositiveIntegerField(default=0)
+    time_to_accept_seconds = models.BigIntegerField(default=0)
+
+    class Meta:
+        ordering = ['day']
+        constraints = [models.UniqueConstraint(fields=['day', 'trade', 'region'], name='unique_market_daily_stat')]
+        indexes = [models.Index(fields=['trade', 'region', 'day'])]
+
+    def __str__(self):
+        return f"{self.day} {self.trade} {self.region}"
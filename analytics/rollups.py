@@ -0,0 +1,92 @@
+"""
+Booking rules shared by the signal handlers and backfill_market_stats:
+
+- Counters go to the offer's current (trade, PLZ region) on the local day of
+  the event.
+- An offer adds offers_created and +1 open on its creation day. The first
+  time it leaves OPEN it adds offers_accepted and -1 open, also when it is
+  created as IN_PROGRESS or COMPLETED. Reaching COMPLETED adds
+  offers_completed.
+- Inquiries add inquiries_created on their creation day and
+  inquiries_accepted (with the waiting time) or inquiries_rejected on the
+  day of that decision.
+- Deleting an offer or inquiry retracts what it contributed; archival is not
+  a deletion.
+- Moving an offer to another trade or region moves its open count; counters
+  already booked stay where they are (the backfill can only use the current
+  bucket for them).
+"""
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from jobs.models import Offer, Inquiry
+from .models import MarketDailyStat
+
+OPEN = Offer.JobStatus.OPEN
+
+
+def region_of(zip_code):
+    return (zip_code or '').strip()[:getattr(settings, 'ANALYTICS_PLZ_PREFIX', 2)]
+
+
+def bump_bucket(trade, zip_code, day=None, **deltas):
+    """Add `deltas` to the (day, trade, region) row, creating it if needed"""
+    deltas = {name: value for name, value in deltas.items() if value}
+    if not deltas:
+        return
+    key = {
+        'day': day or timezone.localdate(),
+        'trade': trade.strip(),
+        'region': region_of(zip_code),
+    }
+    try:
+        with transaction.atomic():
+            stat, _ = MarketDailyStat.objects.get_or_create(**key)
+    except IntegrityError:
+        stat = MarketDailyStat.objects.get(**key)
+    updates = {}
+    for name, value in deltas.items():
+        updates[name] = F(name) + value
+        if value < 0 and name != 'open_offers_delta':
+            # Zähler sind nicht negativ; Rücknahmen auf einem anderen Tag nicht unter 0 ziehen
+            updates[name] = Greatest(updates[name], 0)
+    MarketDailyStat.objects.filter(pk=stat.pk).update(**updates)
+
+
+def bump(offer, day=None, **deltas):
+    bump_bucket(offer.trade, offer.zip_code, day, **deltas)
+
+
+def offer_events(offer, accepted_at=None):
+    """[(moment, deltas)] the offer contributes in its current status"""
+    events = [(offer.created_at, {'offers_created': 1, 'open_offers_delta': 1})]
+    if offer.status != OPEN:
+        events.append((accepted_at or offer.updated_at, {'open_offers_delta': -1, 'offers_accepted': 1}))
+    if offer.status == Offer.JobStatus.COMPLETED:
+        events.append((offer.updated_at, {'offers_completed': 1}))
+    return events
+
+
+def inquiry_events(inquiry, offer):
+    """[(moment, deltas)] a hot or archived inquiry contributes in its current status"""
+    events = [(inquiry.created_at, {'inquiries_created': 1})]
+    if inquiry.status == Inquiry.ApplicationStatus.ACCEPTED:
+        waited = int((inquiry.updated_at - offer.created_at).total_seconds())
+        events.append((inquiry.updated_at, {'inquiries_accepted': 1, 'time_to_accept_seconds': waited}))
+    elif inquiry.status == Inquiry.ApplicationStatus.REJECTED:
+        events.append((inquiry.updated_at, {'inquiries_rejected': 1}))
+    return events
+
+
+def book(offer, events, sign=1):
+    for moment, deltas in events:
+        bump(offer, timezone.localdate(moment), **{name: sign * value for name, value in deltas.items()})
+
+
+def record_inquiries_rejected(offer, count):
+    """Bulk rejections bypass model signals, so callers report them explicitly"""
+    if count:
+        bump(offer, inquiries_rejected=count)
@@ -0,0 +1,90 @@
+from django.db.models.signals import pre_save, post_save, pre_delete, post_delete
+from django.dispatch import receiver
+
+from archive.models import ArchivedInquiry
+from jobs.models import Offer, Inquiry
+from .rollups import OPEN, book, bump, bump_bucket, inquiry_events, offer_events, region_of
+
+
+def _remember_state(instance, fields):
+    """Stash the persisted values so post_save can detect the transition"""
+    previous = None
+    if instance.pk:
+        previous = type(instance).objects.filter(pk=instance.pk).values(*fields).first()
+    instance._previous_state = previous
+
+
+@receiver(pre_save, sender=Offer)
+def remember_offer_state(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _remember_state(instance, ['trade', 'zip_code', 'status'])
+
+
+@receiver(pre_save, sender=Inquiry)
+def remember_inquiry_state(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _remember_state(instance, ['status'])
+
+
+@receiver(post_save, sender=Offer)
+def offer_transition(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    previous = getattr(instance, '_previous_state', None)
+    if created or previous is None:
+        book(instance, offer_events(instance))
+        return
+
+    was_open, is_open = previous['status'] == OPEN, instance.status == OPEN
+    old_bucket = (previous['trade'].strip(), region_of(previous['zip_code']))
+    if old_bucket != (instance.trade.strip(), region_of(instance.zip_code)):
+        # Offene Angebote wandern mit, wenn sich Gewerbe oder PLZ-Region ändern
+        bump_bucket(previous['trade'], previous['zip_code'], open_offers_delta=-int(was_open))
+        bump(instance, open_offers_delta=int(is_open))
+    else:
+        bump(instance, open_offers_delta=int(is_open) - int(was_open))
+
+    if previous['status'] == instance.status:
+        return
+    bump(
+        instance,
+        offers_accepted=int(was_open and not is_open),
+        offers_completed=int(instance.status == Offer.JobStatus.COMPLETED),
+    )
+
+
+@receiver(pre_delete, sender=Offer)
+def remember_accepted_at(sender, instance, **kwargs):
+    # Die Anfragen werden vor dem Angebot gelöscht; Annahmezeitpunkt vorher merken
+    instance._accepted_at = None
+    for model in (Inquiry, ArchivedInquiry):
+        accepted = model.objects.filter(offer_id=instance.pk, status=Inquiry.ApplicationStatus.ACCEPTED)
+        instance._accepted_at = instance._accepted_at or accepted.values_list('updated_at', flat=True).first()
+
+
+@receiver(post_delete, sender=Offer)
+def offer_deleted(sender, instance, **kwargs):
+    book(instance, offer_events(instance, getattr(instance, '_accepted_at', None)), sign=-1)
+
+
+@receiver(post_save, sender=Inquiry)
+def inquiry_transition(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    events = inquiry_events(instance, instance.offer)
+    if created:
+        book(instance.offer, events)
+        return
+    previous = getattr(instance, '_previous_state', None)
+    if previous is not None and previous['status'] == instance.status:
+        return
+    # Nur die Entscheidung (angenommen/abgelehnt) neu buchen
+    book(instance.offer, events[1:])
+
+
+@receiver(post_delete, sender=Inquiry)
+@receiver(post_delete, sender=ArchivedInquiry)
+def inquiry_deleted(sender, instance, **kwargs):
+    offer = Offer.objects.filter(pk=instance.offer_id).first()
+    if offer is not None:
+        book(offer, inquiry_events(instance, offer), sign=-1)
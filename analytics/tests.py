@@ -0,0 +1,108 @@
+from datetime import date
+from io import StringIO
+
+from django.core.management import call_command
+from django.db.models import Sum
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from jobs.models import Offer, Inquiry
+from users.models import User
+from .models import MarketDailyStat
+from .views import MarketAnalyticsView
+
+
+class MarketAnalyticsViewTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('markt@example.com', 'pw', role=User.Role.CRAFTSMAN)
+        MarketDailyStat.objects.create(
+            day=date(2025, 1, 10), trade='Elektriker', region='10', offers_created=2, open_offers_delta=2,
+            inquiries_created=4, inquiries_accepted=1, time_to_accept_seconds=7200,
+        )
+
+    def get(self, **params):
+        request = APIRequestFactory().get('/api/analytics/market/', params)
+        force_authenticate(request, user=self.user)
+        return MarketAnalyticsView.as_view()(request)
+
+    def test_totals(self):
+        response = self.get(**{'from': '2025-01-01', 'to': '2025-01-31'})
+        self.assertEqual(response.status_code, 200)
+        row, = response.data['results']
+        self.assertEqual(row['inquiries_per_offer'], 2.0)
+        self.assertEqual(row['avg_time_to_accept_hours'], 2.0)
+        self.assertEqual(row['open_offers'], 2)
+
+    def test_impossible_date_is_rejected(self):
+        self.assertEqual(self.get(**{'from': '2025-02-30'}).status_code, 400)
+        self.assertEqual(self.get(to='2025-13-01').status_code, 400)
+        self.assertEqual(self.get(to='gestern').status_code, 400)
+
+    def test_from_after_to_is_rejected(self):
+        response = self.get(**{'from': '2025-02-01', 'to': '2025-01-01'})
+        self.assertEqual(response.status_code, 400)
+
+
+class MarketRollupTests(TestCase):
+    FIELDS = [
+        'day', 'trade', 'region', 'offers_created', 'offers_accepted', 'offers_completed', 'open_offers_delta',
+        'inquiries_created', 'inquiries_accepted', 'inquiries_rejected', 'time_to_accept_seconds',
+    ]
+
+    def setUp(self):
+        self.craftsman = User.objects.create_user('rollup@example.com', 'pw', role=User.Role.CRAFTSMAN)
+        self.customer = User.objects.create_user('rollup-kunde@example.com', 'pw', role=User.Role.CUSTOMER)
+
+    def create_offer(self, **kwargs):
+        fields = {'title': 'Leitung', 'description': '-', 'trade': 'Elektriker', 'zip_code': '10115', **kwargs}
+        return Offer.objects.create(craftsman=self.craftsman, **fields)
+
+    def stats(self):
+        return [
+            row for row in MarketDailyStat.objects.order_by('day', 'trade', 'region').values(*self.FIELDS)
+            if any(row[name] for name in self.FIELDS[3:])
+        ]
+
+    def assert_matches_backfill(self):
+        incremental = self.stats()
+        call_command('backfill_market_stats', stdout=StringIO())
+        self.assertEqual(self.stats(), incremental)
+
+    def open_offers(self, region):
+        return MarketDailyStat.objects.filter(region=region).aggregate(total=Sum('open_offers_delta'))['total']
+
+    def test_moving_an_open_offer_moves_its_open_count(self):
+        offer = self.create_offer()
+        offer.zip_code = '20095'
+        offer.save()
+        self.assertEqual((self.open_offers('10'), self.open_offers('20')), (0, 1))
+        offer.status = Offer.JobStatus.IN_PROGRESS
+        offer.save()
+        self.assertEqual((self.open_offers('10'), self.open_offers('20')), (0, 0))
+
+    def test_offer_created_in_progress(self):
+        self.create_offer(status=Offer.JobStatus.IN_PROGRESS)
+        self.assert_matches_backfill()
+
+    def test_accept_and_complete(self):
+        offer = self.create_offer()
+        inquiry = Inquiry.objects.create(offer=offer, customer=self.customer)
+        inquiry.status = Inquiry.ApplicationStatus.ACCEPTED
+        inquiry.save()
+        offer.status = Offer.JobStatus.IN_PROGRESS
+        offer.save()
+        offer.status = Offer.JobStatus.COMPLETED
+        offer.save()
+        self.assert_matches_backfill()
+
+    def test_deleted_offer_is_retracted(self):
+        self.create_offer()
+        offer = self.create_offer(zip_code='20095')
+        inquiry = Inquiry.objects.create(offer=offer, customer=self.customer)
+        inquiry.status = Inquiry.ApplicationStatus.ACCEPTED
+        inquiry.save()
+        offer.status = Offer.JobStatus.IN_PROGRESS
+        offer.save()
+        offer.delete()
+        self.assert_matches_backfill()
+        self.assertFalse(MarketDailyStat.objects.filter(region='20').exclude(offers_created=0).exists())
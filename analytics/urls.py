@@ -0,0 +1,7 @@
+from django.urls import path
+
+from .views import MarketAnalyticsView
+
+urlpatterns = [
+    path('analytics/market/', MarketAnalyticsView.as_view(), name='analytics-market'),
+]
@@ -0,0 +1,76 @@
+from datetime import timedelta
+
+from django.db.models import Sum
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .models import MarketDailyStat
+
+COUNTERS = [
+    'offers_created', 'offers_accepted', 'offers_completed', 'inquiries_created',
+    'inquiries_accepted', 'inquiries_rejected', 'time_to_accept_seconds',
+]
+
+
+def _ratio(numerator, denominator):
+    return round(numerator / denominator, 3) if denominator else None
+
+
+class MarketAnalyticsView(APIView):
+    """
+    Supply and demand per trade and PLZ region from the daily rollups
+    GET /api/analytics/market/?trade=Elektriker&region=10&from=2025-01-01&to=2025-01-31&interval=day
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        params = request.query_params
+        today = timezone.localdate()
+        try:
+            date_to = parse_date(params['to']) if params.get('to') else today
+            date_from = parse_date(params['from']) if params.get('from') else None
+        except ValueError:
+            date_to = date_from = None
+        if not date_to or (params.get('from') and not date_from):
+            return Response({'error': 'from/to müssen Datumsangaben (YYYY-MM-DD) sein.'}, status=status.HTTP_400_BAD_REQUEST)
+        date_from = date_from or date_to - timedelta(days=30)
+        if date_from > date_to:
+            return Response({'error': 'from darf nicht nach to liegen.'}, status=status.HTTP_400_BAD_REQUEST)
+        interval = params.get('interval', 'total')
+        if interval not in ('total', 'day'):
+            return Response({'error': "interval muss 'total' oder 'day' sein."}, status=status.HTTP_400_BAD_REQUEST)
+
+        stats = MarketDailyStat.objects.all()
+        if params.get('trade'):
+            stats = stats.filter(trade=params['trade'])
+        if params.get('region'):
+            stats = stats.filter(region__startswith=params['region'])
+
+        group = ['trade', 'region'] + (['day'] if interval == 'day' else [])
+        rows = (
+            stats.filter(day__gte=date_from, day__lte=date_to)
+            .values(*group)
+            .annotate(**{name: Sum(name) for name in COUNTERS})
+            .order_by(*group)
+        )
+        # Offene Angebote = Summe aller Deltas bis zum Stichtag
+        open_offers = {
+            (row['trade'], row['region']): row['open_offers']
+            for row in stats.filter(day__lte=date_to).values('trade', 'region').annotate(open_offers=Sum('open_offers_delta'))
+        }
+
+        results = []
+        for row in rows:
+            item = {key: row[key] for key in group}
+            item.update({name: row[name] for name in COUNTERS if name != 'time_to_accept_seconds'})
+            item['inquiries_per_offer'] = _ratio(row['inquiries_created'], row['offers_created'])
+            item['acceptance_rate'] = _ratio(row['inquiries_accepted'], row['inquiries_created'])
+            avg_seconds = _ratio(row['time_to_accept_seconds'], row['inquiries_accepted'])
+            item['avg_time_to_accept_hours'] = round(avg_seconds / 3600, 2) if avg_seconds is not None else None
+            if interval == 'total':
+                item['open_offers'] = open_offers.get((row['trade'], row['region']), 0)
+            results.append(item)
+        return Response({'from': date_from, 'to': date_to, 'interval': interval, 'results': results})
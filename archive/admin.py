@@ -0,0 +1,34 @@
+from django.contrib import admin
+from .models import ArchivedChatRoom, ArchivedMessage, ArchivedInquiry, ArchivedNotification, ArchiveRun
+from users.admin_mixins import LargeTableAdminMixin
+
+
+@admin.register(ArchivedChatRoom)
+class ArchivedChatRoomAdmin(LargeTableAdminMixin, admin.ModelAdmin):
+    list_display = ('id', 'job_id', 'customer', 'craftsman', 'updated_at', 'archived_at')
+    list_select_related = ('customer', 'craftsman')
+
+
+@admin.register(ArchivedMessage)
+class ArchivedMessageAdmin(LargeTableAdminMixin, admin.ModelAdmin):
+    list_display = ('id', 'chat_room_id', 'sender', 'created_at', 'archived_at')
+    list_select_related = ('sender',)
+    list_filter = (('created_at', admin.DateFieldListFilter),)
+
+
+@admin.register(ArchivedInquiry)
+class ArchivedInquiryAdmin(LargeTableAdminMixin, admin.ModelAdmin):
+    list_display = ('id', 'offer_id', 'customer', 'status', 'created_at', 'archived_at')
+    list_select_related = ('customer',)
+
+
+@admin.register(ArchivedNotification)
+class ArchivedNotificationAdmin(LargeTableAdminMixin, admin.ModelAdmin):
+    list_display = ('id', 'user', 'notification_type', 'title', 'created_at', 'archived_at')
+    list_select_related = ('user',)
+    list_filter = (('created_at', admin.DateFieldListFilter),)
+
+
+@admin.register(ArchiveRun)
+class ArchiveRunAdmin(admin.ModelAdmin):
+    list_display = ('started_at', 'finished_at', 'rows_moved', 'bytes_reclaimed')
@@ -0,0 +1,153 @@
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from chat.models import ChatRoom, Message
+from jobs.models import Offer, Inquiry
+from notifications.models import Notification
+from .models import ArchivedChatRoom, ArchivedMessage, ArchivedInquiry, ArchivedNotification, ArchiveRun
+
+HOT_TABLES = [Notification, Message, ChatRoom, Inquiry]
+
+
+class ArchiveError(Exception):
+    pass
+
+
+def _cutoff(setting, default_days):
+    return timezone.now() - timedelta(days=getattr(settings, setting, default_days))
+
+
+def _copy(hot_model, archive_model, ids):
+    """Copy the given hot rows and return the ids that now exist in the archive"""
+    columns = [field.attname for field in hot_model._meta.concrete_fields]
+    rows = list(hot_model.objects.filter(pk__in=ids).values(*columns))
+    archive_model.objects.bulk_create([archive_model(**row) for row in rows], ignore_conflicts=True)
+    copied = [row['id'] for row in rows]
+    missing = set(copied) - set(archive_model.objects.filter(pk__in=copied).values_list('pk', flat=True))
+    if missing:
+        raise ArchiveError(f"{archive_model.__name__}: {len(missing)} Zeilen nicht kopiert, z.B. #{min(missing)}")
+    return copied
+
+
+def _move(hot_model, archive_model, ids):
+    """
+    Copy rows to the archive table and remove them from the hot table in one
+    short transaction. The raw delete skips model signals on purpose: archived
+    rows are not deletions (no sync tombstones, offer cards keep their counts).
+    """
+    with transaction.atomic():
+        copied = _copy(hot_model, archive_model, ids)
+        queryset = hot_model.objects.filter(pk__in=copied)
+        queryset._raw_delete(queryset.db)
+    return len(copied)
+
+
+def _batches(queryset, batch_size):
+    """Yield pk batches; each batch is re-queried so moved rows drop out"""
+    while True:
+        ids = list(queryset.order_by('pk').values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            return
+        yield ids
+
+
+def table_bytes(models):
+    """Approximate on-disk size of the given tables, None if the backend can't tell"""
+    tables = [model._meta.db_table for model in models]
+    placeholders = ', '.join(['%s'] * len(tables))
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute(f"SELECT SUM(pg_total_relation_size(c.oid)) FROM pg_class c WHERE c.relname IN ({placeholders})", tables)
+        elif connection.vendor == 'mysql':
+            cursor.execute(
+                "SELECT SUM(data_length + index_length) FROM information_schema.tables "
+                f"WHERE table_schema = DATABASE() AND table_name IN ({placeholders})",
+                tables,
+            )
+        elif connection.vendor == 'sqlite':
+            try:
+                # dbstat zählt Tabellen- und Indexseiten; freie Seiten landen in der Freelist
+                cursor.execute(
+                    f"SELECT SUM(pgsize) FROM dbstat WHERE name IN ({placeholders}) "
+                    f"OR name IN (SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name IN ({placeholders}))",
+                    tables + tables,
+                )
+            except Exception:
+                return None
+        else:
+            return None
+        row = cursor.fetchone()
+    return int(row[0]) if row and row[0] is not None else None
+
+
+def archive_notifications(batch_size, pause=0):
+    cutoff = _cutoff('ARCHIVE_NOTIFICATION_DAYS', 90)
+    eligible = Notification.objects.filter(is_read=True, created_at__lt=cutoff)
+    moved = 0
+    for ids in _batches(eligible, batch_size):
+        moved += _move(Notification, ArchivedNotification, ids)
+        time.sleep(pause)
+    return moved
+
+
+def archive_chats(batch_size, pause=0):
+    """Chat rooms of offers completed before the cutoff, together with their messages"""
+    cutoff = _cutoff('ARCHIVE_CHAT_DAYS', 180)
+    eligible = ChatRoom.objects.filter(
+        job__status=Offer.JobStatus.COMPLETED, job__updated_at__lt=cutoff, updated_at__lt=cutoff,
+    )
+    rooms = messages = 0
+    for room_ids in _batches(eligible, max(batch_size // 10, 1)):
+        # Räume zuerst kopieren, damit archivierte Nachrichten sie referenzieren können
+        with transaction.atomic():
+            _copy(ChatRoom, ArchivedChatRoom, room_ids)
+        for message_ids in _batches(Message.objects.filter(chat_room_id__in=room_ids), batch_size):
+            messages += _move(Message, ArchivedMessage, message_ids)
+            time.sleep(pause)
+        with transaction.atomic():
+            late_ids = list(Message.objects.filter(chat_room_id__in=room_ids).values_list('pk', flat=True))
+            if late_ids:
+                messages += _move(Message, ArchivedMessage, late_ids)
+            rooms += _move(ChatRoom, ArchivedChatRoom, room_ids)
+        time.sleep(pause)
+    return rooms, messages
+
+
+def archive_inquiries(batch_size, pause=0):
+    """Rejected inquiries and accepted ones of completed offers"""
+    cutoff = _cutoff('ARCHIVE_INQUIRY_DAYS', 180)
+    eligible = Inquiry.objects.filter(updated_at__lt=cutoff).filter(
+        Q(status=Inquiry.ApplicationStatus.REJECTED)
+        | Q(status=Inquiry.ApplicationStatus.ACCEPTED, offer__status=Offer.JobStatus.COMPLETED)
+    )
+    moved = 0
+    for ids in _batches(eligible, batch_size):
+        moved += _move(Inquiry, ArchivedInquiry, ids)
+        time.sleep(pause)
+    return moved
+
+
+def run_archival(batch_size=None, pause=0):
+    batch_size = batch_size or getattr(settings, 'ARCHIVE_BATCH_SIZE', 1000)
+    run = ArchiveRun.objects.create()
+    size_before = table_bytes(HOT_TABLES)
+
+    rooms, messages = archive_chats(batch_size, pause)
+    run.rows_moved = {
+        'notifications': archive_notifications(batch_size, pause),
+        'chat_rooms': rooms,
+        'messages': messages,
+        'inquiries': archive_inquiries(batch_size, pause),
+    }
+
+    size_after = table_bytes(HOT_TABLES)
+    if size_before is not None and size_after is not None:
+        run.bytes_reclaimed = max(size_before - size_after, 0)
+    run.finished_at = timezone.now()
+    run.save()
+    return run
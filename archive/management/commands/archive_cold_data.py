@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from archive.archiver import ArchiveError, run_archival
+
+
+class Command(BaseCommand):
+    help = (
+        "Verschiebt gelesene Benachrichtigungen, Chats lange abgeschlossener Aufträge "
+        "und geschlossene Anfragen in Archivtabellen (in kleinen Batches)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=None)
+        parser.add_argument('--pause', type=float, default=0, help="Pause in Sekunden zwischen Batches.")
+
+    def handle(self, *args, **options):
+        try:
+            run = run_archival(batch_size=options['batch_size'], pause=options['pause'])
+        except ArchiveError as exc:
+            raise CommandError(f"Archivierung abgebrochen: {exc}")
+        for table, count in run.rows_moved.items():
+            self.stdout.write(f"{table}: {count} Zeilen archiviert")
+        if run.bytes_reclaimed is None:
+            self.stdout.write("Freigegebener Speicher: unbekannt (Datenbank liefert keine Tabellengrößen)")
+        else:
+            self.stdout.write(f"Freigegebener Speicher: {run.bytes_reclaimed / 1024 / 1024:.1f} MiB")
+        self.stdout.write(self.style.SUCCESS("Archivierung abgeschlossen."))
@@ -0,0 +1,25 @@
+from django.db import migrations
+
+MYSQL_INDEX = 'archive_archivedmessage_content_ft'
+
+
+def create_index(apps, schema_editor):
+    # SQLite: archivierte Nachrichten bleiben in chat_message_fts (gleiche IDs)
+    if schema_editor.connection.vendor == 'mysql':
+        schema_editor.execute(f"ALTER TABLE archive_archivedmessage ADD FULLTEXT INDEX {MYSQL_INDEX} (content)")
+
+
+def drop_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'mysql':
+        schema_editor.execute(f"ALTER TABLE archive_archivedmessage DROP INDEX {MYSQL_INDEX}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('archive', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
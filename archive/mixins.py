@@ -0,0 +1,83 @@
+import base64
+
+from django.db.models import Q
+from django.http import Http404
+from django.utils.dateparse import parse_datetime
+from rest_framework import status
+from rest_framework.response import Response
+
+
+class ArchiveFallbackMixin:
+    """
+    ViewSet mixin that falls back to the archive tables for reads.
+
+    Detail lookups that miss the hot table are served from
+    `get_archive_queryset()`. Lists stay on the hot table unless the client
+    passes ?include_archived=true; then both tables are sorted and limited
+    in the database and the merged page is returned as
+    {"results": [...], "next": <cursor>}. Archived rows are read-only.
+    """
+    archive_ordering = None
+    archive_page_size = 50
+
+    def get_archive_queryset(self):
+        raise NotImplementedError
+
+    def include_archived(self):
+        return self.request.query_params.get('include_archived') in ('1', 'true')
+
+    def get_object(self):
+        try:
+            return super().get_object()
+        except Http404:
+            if self.request.method not in ('GET', 'HEAD'):
+                raise
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            archived = self.get_archive_queryset().filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]}).first()
+            if archived is None:
+                raise
+            return archived
+
+    def list(self, request, *args, **kwargs):
+        if not self.include_archived():
+            return super().list(request, *args, **kwargs)
+        field, descending = self.archive_ordering.lstrip('-'), self.archive_ordering.startswith('-')
+        try:
+            after = _decode_cursor(request.query_params.get('cursor'))
+        except ValueError:
+            return Response({'error': 'Ungültiger cursor.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Keyset (field, pk) in beiden Tabellen; archivierte Zeilen behalten ihre IDs
+        ordering = [self.archive_ordering, '-pk' if descending else 'pk']
+        limit = self.archive_page_size
+        rows = []
+        for queryset in (self.get_queryset(), self.get_archive_queryset()):
+            queryset = self.filter_queryset(queryset)
+            if after:
+                value, pk = after
+                op = 'lt' if descending else 'gt'
+                queryset = queryset.filter(Q(**{f'{field}__{op}': value}) | Q(**{field: value, f'pk__{op}': pk}))
+            rows.extend(queryset.order_by(*ordering)[:limit + 1])
+        rows.sort(key=lambda obj: (getattr(obj, field), obj.pk), reverse=descending)
+
+        page = rows[:limit]
+        next_cursor = _encode_cursor(getattr(page[-1], field), page[-1].pk) if len(rows) > limit else None
+        return Response({'results': self.get_serializer(page, many=True).data, 'next': next_cursor})
+
+
+def _encode_cursor(value, pk):
+    return base64.urlsafe_b64encode(f'{value.isoformat()}|{pk}'.encode()).decode()
+
+
+def _decode_cursor(cursor):
+    if not cursor:
+        return None
+    try:
+        value, pk = base64.urlsafe_b64decode(cursor.encode()).decode().rsplit('|', 1)
+        moment = parse_datetime(value)
+        pk = int(pk)
+    except (TypeError, UnicodeError, ValueError) as exc:
+        raise ValueError(str(exc))
+    if moment is None:
+        raise ValueError(value)
+    return moment, pk
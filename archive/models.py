@@ -0,0 +1,96 @@
+from django.db import models
+from django.conf import settings
+
+from notifications.models import Notification
+
+
+class ArchivedChatRoom(models.Model):
+    """
+    Cold copy of chat.ChatRoom. Field names mirror the hot model so the
+    existing serializers can render archived rows unchanged.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    job = models.ForeignKey('jobs.Offer', on_delete=models.CASCADE, related_name='archived_chat_rooms')
+    customer = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='archived_customer_chats')
+    craftsman = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='archived_craftsman_chats')
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-updated_at']
+
+    def __str__(self):
+        return f"Archivierter Chat #{self.pk}"
+
+
+class ArchivedMessage(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    chat_room = models.ForeignKey(ArchivedChatRoom, on_delete=models.CASCADE, related_name='messages')
+    sender = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='archived_sent_messages')
+    content = models.TextField()
+    is_read = models.BooleanField(default=False)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['created_at']
+        indexes = [models.Index(fields=['chat_room', 'created_at'])]
+
+    def __str__(self):
+        return f"Archivierte Nachricht #{self.pk}"
+
+
+class ArchivedInquiry(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    offer = models.ForeignKey('jobs.Offer', on_delete=models.CASCADE, related_name='archived_inquiries')
+    customer = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='archived_inquiries')
+    status = models.CharField(max_length=20)
+    cover_letter = models.TextField(blank=True)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"Archivierte Anfrage #{self.pk}"
+
+
+class ArchivedNotification(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='archived_notifications')
+    notification_type = models.CharField(max_length=50, choices=Notification.NOTIFICATION_TYPES)
+    title = models.CharField(max_length=255)
+    message = models.TextField()
+    is_read = models.BooleanField(default=True)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    job_id = models.IntegerField(null=True, blank=True)
+    application_id = models.IntegerField(null=True, blank=True)
+    chat_room_id = models.IntegerField(null=True, blank=True)
+    review_id = models.IntegerField(null=True, blank=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [models.Index(fields=['user', 'created_at'])]
+
+    def __str__(self):
+        return f"Archivierte Benachrichtigung #{self.pk}"
+
+
+class ArchiveRun(models.Model):
+    """Report of one archival run (rows moved per table, bytes reclaimed in the hot tables)"""
+    started_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    rows_moved = models.JSONField(default=dict)
+    bytes_reclaimed = models.BigIntegerField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-started_at']
+
+    def __str__(self):
+        return f"Archivierung {self.started_at:%Y-%m-%d %H:%M}"
@@ -0,0 +1,114 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import serializers, viewsets
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from analytics.models import MarketDailyStat
+from chat.models import ChatRoom, Message
+from chat.search import search_messages
+from jobs.models import Offer, Inquiry, OfferCard
+from notifications.models import Notification
+from users.models import User
+from .archiver import ArchiveError, run_archival
+from .mixins import ArchiveFallbackMixin
+from .models import ArchivedChatRoom, ArchivedInquiry, ArchivedNotification
+
+
+class NotificationSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+
+
+class NotificationViewSet(ArchiveFallbackMixin, viewsets.ReadOnlyModelViewSet):
+    serializer_class = NotificationSerializer
+    archive_ordering = '-created_at'
+
+    def get_queryset(self):
+        return Notification.objects.filter(user=self.request.user)
+
+    def get_archive_queryset(self):
+        return ArchivedNotification.objects.filter(user=self.request.user)
+
+
+class ArchivalTests(TestCase):
+    def setUp(self):
+        self.craftsman = User.objects.create_user('alt-handwerker@example.com', 'pw', role=User.Role.CRAFTSMAN)
+        self.customer = User.objects.create_user('alt-kunde@example.com', 'pw', role=User.Role.CUSTOMER)
+        self.other = User.objects.create_user('alt-kunde2@example.com', 'pw', role=User.Role.CUSTOMER)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.offer = Offer.objects.create(
+                craftsman=self.craftsman, title='Dach decken', description='-', trade='Dachdecker', zip_code='20095',
+                status=Offer.JobStatus.COMPLETED,
+            )
+            Inquiry.objects.create(offer=self.offer, customer=self.customer, status=Inquiry.ApplicationStatus.ACCEPTED)
+            Inquiry.objects.create(offer=self.offer, customer=self.other, status=Inquiry.ApplicationStatus.REJECTED)
+            room = ChatRoom.objects.create(job=self.offer, customer=self.customer, craftsman=self.craftsman)
+            Message.objects.create(chat_room=room, sender=self.customer, content='Wann geht es los?')
+        # Alles liegt ein Jahr zurück, ohne Signale auszulösen
+        old = timezone.now() - timedelta(days=365)
+        for model in (Offer, Inquiry, ChatRoom, Message):
+            model.objects.update(created_at=old, updated_at=old)
+
+    def archive(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            run_archival(batch_size=10)
+        self.assertFalse(Inquiry.objects.exists())
+        self.assertFalse(ChatRoom.objects.exists())
+        self.assertEqual(ArchivedInquiry.objects.count(), 2)
+        self.assertEqual(ArchivedChatRoom.objects.count(), 1)
+
+    def test_offer_cards_survive_rebuild(self):
+        call_command('rebuild_offer_cards', stdout=StringIO())
+        self.archive()
+        out = StringIO()
+        call_command('rebuild_offer_cards', '--check', stdout=out)
+        self.assertIn('0 Karten abweichend', out.getvalue())
+        card = OfferCard.objects.get(pk=self.offer.pk)
+        self.assertEqual((card.inquiry_count, card.chat_count), (2, 1))
+
+    def test_backfill_keeps_archived_inquiries(self):
+        fields = ['day', 'trade', 'region', 'offers_created', 'offers_accepted', 'offers_completed',
+                  'open_offers_delta', 'inquiries_created', 'inquiries_accepted', 'inquiries_rejected',
+                  'time_to_accept_seconds']
+        call_command('backfill_market_stats', stdout=StringIO())
+        before = list(MarketDailyStat.objects.order_by('day').values(*fields))
+        self.archive()
+        call_command('backfill_market_stats', stdout=StringIO())
+        self.assertEqual(list(MarketDailyStat.objects.order_by('day').values(*fields)), before)
+
+    def test_archived_messages_stay_searchable(self):
+        self.archive()
+        hits = search_messages(self.customer, 'wann')
+        self.assertEqual(len(hits), 1)
+        self.assertFalse(search_messages(self.other, 'wann'))
+
+    def test_rows_that_were_not_copied_stay_hot(self):
+        with mock.patch.object(ArchivedInquiry.objects, 'bulk_create'):
+            with self.assertRaises(ArchiveError):
+                run_archival(batch_size=10)
+        self.assertEqual(Inquiry.objects.count(), 2)
+
+    def test_list_merges_archived_rows_on_request(self):
+        now = timezone.now()
+        for i in range(3):
+            old = Notification.objects.create(user=self.customer, notification_type='MESSAGE', title=f'alt {i}', message='-', is_read=True)
+            Notification.objects.filter(pk=old.pk).update(created_at=now - timedelta(days=365 + i))
+        Notification.objects.create(user=self.customer, notification_type='MESSAGE', title='neu', message='-')
+        run_archival(batch_size=10)
+
+        def get(**params):
+            request = APIRequestFactory().get('/api/notifications/', params)
+            force_authenticate(request, user=self.customer)
+            return NotificationViewSet.as_view({'get': 'list'}, archive_page_size=2)(request).data
+
+        self.assertEqual([row['title'] for row in get()], ['neu'])
+        page = get(include_archived='true')
+        self.assertEqual([row['title'] for row in page['results']], ['neu', 'alt 0'])
+        page = get(include_archived='true', cursor=page['next'])
+        self.assertEqual([row['title'] for row in page['results']], ['alt 1', 'alt 2'])
+        self.assertIsNone(page['next'])
@@ -1,5 +1,25 @@
 from django.contrib import admin
 from .models import ChatRoom, Message
+from users.admin_mixins import LargeTableAdminMixin
 
-admin.site.register(ChatRoom)
-admin.site.register(Message)
+
+@admin.register(ChatRoom)
+class ChatRoomAdmin(admin.ModelAdmin):
+    list_display = ('id', 'job', 'customer', 'craftsman', 'updated_at')
+    list_select_related = ('job', 'customer', 'craftsman')
+    search_fields = ('=id', 'customer__email', 'craftsman__email')
+    autocomplete_fields = ('job', 'customer', 'craftsman')
+    show_full_result_count = False
+
+
+@admin.register(Message)
+class MessageAdmin(LargeTableAdminMixin, admin.ModelAdmin):
+    list_display = ('id', 'sender', 'chat_room_id', 'short_content', 'is_read', 'created_at')
+    list_select_related = ('sender',)
+    # Feste Zeiträume statt date_hierarchy (die liest alle Jahre per DISTINCT über die Tabelle)
+    list_filter = ('is_read', ('created_at', admin.DateFieldListFilter))
+    autocomplete_fields = ('chat_room', 'sender')
+
+    @admin.display(description='Inhalt')
+    def short_content(self, obj):
+        return obj.content[:50]
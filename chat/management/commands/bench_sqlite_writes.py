@@ -0,0 +1,98 @@
+import copy
+import os
+import tempfile
+import time
+from multiprocessing import Pool
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connections, transaction
+from django.db.utils import load_backend
+
+BENCH_ALIAS = 'bench'
+
+
+def _settings_dict(path, profile):
+    """
+    Settings for the benchmark database. 'production' keeps OPTIONS from
+    DATABASES['default'] (init_command pragmas, transaction_mode), so broken
+    settings wiring shows up here; 'default' is Django's plain SQLite setup.
+    """
+    settings_dict = copy.deepcopy(connections['default'].settings_dict)
+    settings_dict['NAME'] = path
+    if profile == 'default':
+        settings_dict['OPTIONS'] = {}
+    return settings_dict
+
+
+def _connect(settings_dict):
+    """Register a Django connection for the benchmark database in this process"""
+    backend = load_backend(settings_dict['ENGINE'])
+    connections[BENCH_ALIAS] = backend.DatabaseWrapper(settings_dict, BENCH_ALIAS)
+    return connections[BENCH_ALIAS]
+
+
+def _worker(args):
+    """Simulate message posting: read the room, insert a message, touch the room"""
+    settings_dict, worker_id, writes = args
+    connection = _connect(settings_dict)
+    ok = errors = 0
+    for i in range(writes):
+        try:
+            with transaction.atomic(using=BENCH_ALIAS), connection.cursor() as cursor:
+                cursor.execute("SELECT updated_at FROM room WHERE id = 1")
+                cursor.fetchone()
+                cursor.execute("INSERT INTO message (room_id, content) VALUES (1, %s)", [f"w{worker_id}-{i}"])
+                cursor.execute("UPDATE room SET updated_at = %s WHERE id = 1", [time.time()])
+            ok += 1
+        except OperationalError:
+            errors += 1
+    connection.close()
+    return ok, errors
+
+
+class Command(BaseCommand):
+    help = (
+        "Vergleicht Schreibdurchsatz und Lock-Fehler von SQLite mit Djangos Standardverbindung "
+        "und der Verbindung aus DATABASES['default'] (Produktionsprofil)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=8)
+        parser.add_argument('--writes', type=int, default=500)
+
+    def handle(self, *args, **options):
+        if options['workers'] < 1 or options['writes'] < 1:
+            raise CommandError("--workers und --writes müssen mindestens 1 sein.")
+        if connections['default'].vendor != 'sqlite':
+            raise CommandError("DATABASES['default'] ist keine SQLite-Datenbank.")
+        options_in_use = connections['default'].settings_dict['OPTIONS']
+        self.stdout.write(f"OPTIONS aus DATABASES['default']: {options_in_use}")
+        if 'init_command' not in options_in_use:
+            self.stdout.write(self.style.WARNING(
+                "Kein init_command gesetzt: das Produktionsprofil ist nicht aktiv (DEBUG ohne SQLITE_PROFILE=production?)."
+            ))
+
+        for profile in ('default', 'production'):
+            with tempfile.TemporaryDirectory() as tmp:
+                settings_dict = _settings_dict(os.path.join(tmp, 'bench.sqlite3'), profile)
+                connection = _connect(settings_dict)
+                with connection.cursor() as cursor:
+                    cursor.execute("CREATE TABLE room (id INTEGER PRIMARY KEY, updated_at REAL)")
+                    cursor.execute("CREATE TABLE message (id INTEGER PRIMARY KEY, room_id INTEGER, content TEXT)")
+                    cursor.execute("INSERT INTO room (id, updated_at) VALUES (1, 0)")
+                    cursor.execute("PRAGMA journal_mode")
+                    journal_mode = cursor.fetchone()[0]
+                connection.close()
+
+                jobs = [(settings_dict, w, options['writes']) for w in range(options['workers'])]
+                start = time.perf_counter()
+                with Pool(options['workers']) as pool:
+                    results = pool.map(_worker, jobs)
+                elapsed = time.perf_counter() - start
+
+            ok = sum(r[0] for r in results)
+            errors = sum(r[1] for r in results)
+            self.stdout.write(
+                f"{profile:>10} ({journal_mode}): {ok / elapsed:8.0f} writes/s, "
+                f"{errors} lock errors ({100 * errors / (ok + errors):.1f}%)"
+            )
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from chat.search import rebuild_index
+
+
+class Command(BaseCommand):
+    help = "Baut den Volltextindex für Chat-Nachrichten neu auf."
+
+    def handle(self, *args, **options):
+        rebuild_index()
+        self.stdout.write(self.style.SUCCESS("Nachrichtenindex neu aufgebaut."))
@@ -0,0 +1,32 @@
+from django.db import migrations
+
+FTS_TABLE = 'chat_message_fts'
+MYSQL_INDEX = 'chat_message_content_ft'
+
+
+def create_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        schema_editor.execute(f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(content, tokenize = 'unicode61')")
+        schema_editor.execute(f"INSERT INTO {FTS_TABLE} (rowid, content) SELECT id, content FROM chat_message")
+    elif vendor == 'mysql':
+        schema_editor.execute(f"ALTER TABLE chat_message ADD FULLTEXT INDEX {MYSQL_INDEX} (content)")
+
+
+def drop_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+    elif vendor == 'mysql':
+        schema_editor.execute(f"ALTER TABLE chat_message DROP INDEX {MYSQL_INDEX}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
@@ -18,7 +18,7 @@ class ChatRoom(models.Model):
         related_name='craftsman_chats'
     )
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     class Meta:
         unique_together = ('job', 'customer', 'craftsman')
@@ -41,9 +41,15 @@ class Message(models.Model):
     content = models.TextField()
     is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     class Meta:
         ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['chat_room', 'created_at']),
+            models.Index(fields=['created_at']),
+            models.Index(fields=['is_read', 'created_at']),
+        ]
 
     def __str__(self):
         return f"{self.sender.email}: {self.content[:50]}"
\ No newline at end of file
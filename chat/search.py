@@ -0,0 +1,118 @@
+import html
+import re
+
+from django.db import connection, transaction
+from django.db.models import Q
+
+from archive.models import ArchivedMessage
+from .models import Message
+
+FTS_TABLE = 'chat_message_fts'
+SNIPPET_TOKENS = 12
+SNIPPET_CHARS = 80
+HL_START = '\x02'
+HL_END = '\x03'
+
+
+def _tokens(query):
+    return [t for t in re.findall(r'\w+', query, re.UNICODE) if t]
+
+
+def rebuild_index():
+    """
+    Refill the SQLite FTS table from chat_message and the message archive
+    (archived messages keep their ids). The table itself and the MySQL
+    FULLTEXT indexes are created by migrations.
+    """
+    if connection.vendor != 'sqlite':
+        return
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE}")
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, content) "
+            "SELECT id, content FROM chat_message UNION ALL SELECT id, content FROM archive_archivedmessage"
+        )
+
+
+def index_message(message):
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [message.pk])
+        cursor.execute(f"INSERT INTO {FTS_TABLE} (rowid, content) VALUES (%s, %s)", [message.pk, message.content])
+
+
+def unindex_message(message_id):
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [message_id])
+
+
+def _highlight(text, tokens):
+    """Build a snippet around the first match and mark all tokens (Python fallback)"""
+    lowered = text.lower()
+    positions = [lowered.find(t.lower()) for t in tokens]
+    positions = [p for p in positions if p >= 0]
+    start = max(min(positions) - SNIPPET_CHARS // 2, 0) if positions else 0
+    snippet = text[start:start + SNIPPET_CHARS]
+    if start > 0:
+        snippet = '…' + snippet
+    if start + SNIPPET_CHARS < len(text):
+        snippet += '…'
+    pattern = re.compile('|'.join(re.escape(t) for t in tokens), re.IGNORECASE)
+    return pattern.sub(lambda m: f'{HL_START}{m.group(0)}{HL_END}', snippet)
+
+
+def _render(snippet):
+    return html.escape(snippet).replace(HL_START, '<mark>').replace(HL_END, '</mark>')
+
+
+def search_messages(user, query, before_id=None, limit=20):
+    """
+    Full-text search in the chat rooms where `user` is customer or craftsman,
+    archived chats included. Returns [(message_id, snippet_html), ...] newest
+    first; `before_id` is the keyset cursor (id of the last message on the
+    previous page).
+    """
+    tokens = _tokens(query)
+    if not tokens:
+        return []
+
+    if connection.vendor == 'sqlite':
+        match = ' '.join('"%s"' % t.replace('"', '""') for t in tokens) + '*'
+        sql = (
+            f"SELECT m.id, snippet({FTS_TABLE}, 0, char(2), char(3), '…', {SNIPPET_TOKENS}) "
+            f"FROM {FTS_TABLE} "
+            f"LEFT JOIN chat_message m ON m.id = {FTS_TABLE}.rowid "
+            f"LEFT JOIN chat_chatroom r ON r.id = m.chat_room_id "
+            f"LEFT JOIN archive_archivedmessage am ON am.id = {FTS_TABLE}.rowid "
+            f"LEFT JOIN archive_archivedchatroom ar ON ar.id = am.chat_room_id "
+            f"WHERE {FTS_TABLE} MATCH %s "
+            f"AND (%s IN (r.customer_id, r.craftsman_id) OR %s IN (ar.customer_id, ar.craftsman_id))"
+        )
+        params = [match, user.pk, user.pk]
+        if before_id:
+            sql += f" AND {FTS_TABLE}.rowid < %s"
+            params.append(before_id)
+        sql += f" ORDER BY {FTS_TABLE}.rowid DESC LIMIT %s"
+        params.append(limit)
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return [(pk, _render(snippet)) for pk, snippet in cursor.fetchall()]
+
+    rows = []
+    for model in (Message, ArchivedMessage):
+        queryset = model.objects.filter(Q(chat_room__customer=user) | Q(chat_room__craftsman=user))
+        if connection.vendor == 'mysql':
+            boolean_query = ' '.join(f'+{t}*' for t in tokens)
+            where = f'MATCH ({model._meta.db_table}.content) AGAINST (%s IN BOOLEAN MODE)'
+            queryset = queryset.extra(where=[where], params=[boolean_query])
+        else:
+            for token in tokens:
+                queryset = queryset.filter(content__icontains=token)
+        if before_id:
+            queryset = queryset.filter(id__lt=before_id)
+        rows.extend(queryset.order_by('-id').values_list('id', 'content')[:limit])
+    rows = sorted(rows, reverse=True)[:limit]
+    return [(pk, _render(_highlight(content, tokens))) for pk, content in rows]
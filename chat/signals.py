@@ -0,0 +1,20 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from archive.models import ArchivedMessage
+from .models import Message
+from .search import index_message, unindex_message
+
+
+@receiver(post_save, sender=Message)
+def message_saved(sender, instance, update_fields=None, **kwargs):
+    """Keep the full-text index in sync (skip saves that don't touch content)"""
+    if update_fields is not None and 'content' not in update_fields:
+        return
+    index_message(instance)
+
+
+@receiver(post_delete, sender=Message)
+@receiver(post_delete, sender=ArchivedMessage)
+def message_deleted(sender, instance, **kwargs):
+    unindex_message(instance.pk)
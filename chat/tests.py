@@ -1,3 +1,74 @@
+from io import StringIO
+from unittest import mock
+
+from django.conf import settings
+from django.core.management import CommandError, call_command
+from django.db import connections, transaction
 from django.test import TestCase
 
-# Create your tests here.
+from jobs.models import Offer
+from users.models import User
+from .models import ChatRoom, Message
+from .search import search_messages
+
+
+class MessageSearchTests(TestCase):
+    def setUp(self):
+        self.customer = User.objects.create_user('kunde@example.com', 'pw')
+        self.craftsman = User.objects.create_user('handwerker@example.com', 'pw', role=User.Role.CRAFTSMAN)
+        self.outsider = User.objects.create_user('fremd@example.com', 'pw')
+        offer = Offer.objects.create(
+            craftsman=self.craftsman, title='Bad', description='-', trade='Fliesenleger', zip_code='10115',
+        )
+        self.room = ChatRoom.objects.create(job=offer, customer=self.customer, craftsman=self.craftsman)
+
+    def test_search_finds_new_message(self):
+        message = Message.objects.create(chat_room=self.room, sender=self.customer, content='Die Fliesen sind kaputt')
+        hits = search_messages(self.customer, 'fliesen')
+        self.assertEqual([pk for pk, _ in hits], [message.pk])
+        self.assertIn('<mark>Fliesen</mark>', hits[0][1])
+
+    def test_search_after_previous_test_rolled_back(self):
+        # Läuft nach einem anderen Test, dessen Transaktion zurückgerollt wurde
+        message = Message.objects.create(chat_room=self.room, sender=self.craftsman, content='Fliesen kommen morgen')
+        self.assertEqual([pk for pk, _ in search_messages(self.craftsman, 'fliesen')], [message.pk])
+
+    def test_create_after_rolled_back_atomic_block(self):
+        try:
+            with transaction.atomic():
+                Message.objects.create(chat_room=self.room, sender=self.customer, content='verworfen')
+                raise RuntimeError
+        except RuntimeError:
+            pass
+        message = Message.objects.create(chat_room=self.room, sender=self.customer, content='Silikonfuge erneuern')
+        self.assertEqual([pk for pk, _ in search_messages(self.customer, 'silikonfuge')], [message.pk])
+        self.assertEqual(search_messages(self.customer, 'verworfen'), [])
+
+    def test_search_is_restricted_to_own_rooms(self):
+        Message.objects.create(chat_room=self.room, sender=self.customer, content='Fliesen')
+        self.assertEqual(search_messages(self.outsider, 'fliesen'), [])
+
+    def test_deleted_message_is_removed_from_index(self):
+        message = Message.objects.create(chat_room=self.room, sender=self.customer, content='Fliesen')
+        message.delete()
+        self.assertEqual(search_messages(self.customer, 'fliesen'), [])
+
+    def test_keyset_pagination(self):
+        ids = [Message.objects.create(chat_room=self.room, sender=self.customer, content=f'Fliesen {i}').pk for i in range(3)]
+        first = search_messages(self.customer, 'fliesen', limit=2)
+        second = search_messages(self.customer, 'fliesen', before_id=first[-1][0], limit=2)
+        self.assertEqual([pk for pk, _ in first + second], ids[::-1])
+
+
+class BenchSqliteWritesTests(TestCase):
+    def test_production_run_uses_the_configured_connection_options(self):
+        production = {'init_command': ';'.join(settings.SQLITE_PRAGMAS), 'transaction_mode': 'IMMEDIATE', 'timeout': 5}
+        out = StringIO()
+        with mock.patch.dict(connections['default'].settings_dict, {'OPTIONS': production}):
+            call_command('bench_sqlite_writes', workers=2, writes=5, stdout=out)
+        self.assertIn('production (wal)', out.getvalue())
+        self.assertIn('default (delete)', out.getvalue())
+
+    def test_rejects_empty_runs(self):
+        with self.assertRaises(CommandError):
+            call_command('bench_sqlite_writes', writes=0, stdout=StringIO())
@@ -3,15 +3,23 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.db.models import Q
+from django.utils import timezone
 
 from .models import ChatRoom, Message
 from jobs.models import Offer, Inquiry
 from .serializers import ChatRoomSerializer, MessageSerializer
+from .search import search_messages
+from users.fieldsets import SparseFieldsetMixin
+from archive.mixins import ArchiveFallbackMixin
+from archive.models import ArchivedChatRoom, ArchivedMessage, ArchivedInquiry
 
 
-class ChatRoomViewSet(viewsets.ModelViewSet):
+class ChatRoomViewSet(ArchiveFallbackMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     serializer_class = ChatRoomSerializer
     permission_classes = [IsAuthenticated]
+    # Verschachtelte Nachrichten nur mit ?expand=messages (inkl. prefetch_related)
+    expandable_fields = ('messages',)
+    archive_ordering = '-updated_at'
 
     def get_queryset(self):
         """
@@ -20,7 +28,13 @@ class ChatRoomViewSet(viewsets.ModelViewSet):
         user = self.request.user
         return ChatRoom.objects.filter(
             Q(customer=user) | Q(craftsman=user)
-        ).select_related('job', 'customer', 'craftsman').prefetch_related('messages')
+        ).select_related('job', 'customer', 'craftsman')
+
+    def get_archive_queryset(self):
+        user = self.request.user
+        return ArchivedChatRoom.objects.filter(
+            Q(customer=user) | Q(craftsman=user)
+        ).select_related('job', 'customer', 'craftsman')
 
     @action(detail=False, methods=['post'])
     def get_or_create(self, request):
@@ -44,7 +58,12 @@ class ChatRoomViewSet(viewsets.ModelViewSet):
             return Response({'error': 'Offer not found'}, status=status.HTTP_404_NOT_FOUND)
 
         # New domain rule: customer must have an inquiry for this offer
-        if not Inquiry.objects.filter(offer=job, customer=request.user).exists():
+        # (auch archivierte Anfragen zählen)
+        has_inquiry = (
+            Inquiry.objects.filter(offer=job, customer=request.user).exists()
+            or ArchivedInquiry.objects.filter(offer=job, customer=request.user).exists()
+        )
+        if not has_inquiry:
             return Response(
                 {'error': 'Nur Kunden mit einer Anfrage zu diesem Angebot dürfen chatten.'},
                 status=status.HTTP_403_FORBIDDEN
@@ -56,6 +75,11 @@ class ChatRoomViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        # Ein archivierter Chat wird wiederverwendet statt dupliziert
+        archived = ArchivedChatRoom.objects.filter(job=job, customer=request.user, craftsman_id=craftsman_id).first()
+        if archived is not None:
+            return Response(self.get_serializer(archived).data, status=status.HTTP_200_OK)
+
         chat_room, created = ChatRoom.objects.get_or_create(
             job=job,
             customer=request.user,
@@ -66,9 +90,10 @@ class ChatRoomViewSet(viewsets.ModelViewSet):
         return Response(serializer.data, status=status.HTTP_200_OK if not created else status.HTTP_201_CREATED)
 
 
-class MessageViewSet(viewsets.ModelViewSet):
+class MessageViewSet(ArchiveFallbackMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     serializer_class = MessageSerializer
     permission_classes = [IsAuthenticated]
+    archive_ordering = 'created_at'
 
     def get_queryset(self):
         """
@@ -86,12 +111,61 @@ class MessageViewSet(viewsets.ModelViewSet):
 
         return queryset
 
+    def get_archive_queryset(self):
+        user = self.request.user
+        queryset = ArchivedMessage.objects.filter(
+            Q(chat_room__customer=user) | Q(chat_room__craftsman=user)
+        ).select_related('sender', 'chat_room')
+        chat_room_id = self.request.query_params.get('chat_room')
+        if chat_room_id:
+            queryset = queryset.filter(chat_room_id=chat_room_id)
+        return queryset
+
+    def include_archived(self):
+        # Nachrichten eines archivierten Chats liegen nur im Archiv
+        chat_room_id = self.request.query_params.get('chat_room')
+        if chat_room_id and ArchivedChatRoom.objects.filter(pk=chat_room_id).exists():
+            return True
+        return super().include_archived()
+
     def perform_create(self, serializer):
         """
         Set sender to current user
         """
         serializer.save(sender=self.request.user)
 
+    @action(detail=False, methods=['get'])
+    def search(self, request):
+        """
+        Full-text search in the user's chat history
+        GET /api/messages/search/?q=fliesen&cursor=123&limit=20
+        """
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response({'error': 'q is required'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            cursor = int(request.query_params.get('cursor') or 0) or None
+            limit = min(max(int(request.query_params.get('limit', 20)), 1), 100)
+        except ValueError:
+            return Response({'error': 'cursor and limit must be integers'}, status=status.HTTP_400_BAD_REQUEST)
+
+        hits = search_messages(request.user, query, before_id=cursor, limit=limit + 1)
+        has_more = len(hits) > limit
+        hits = hits[:limit]
+        ids = [pk for pk, _ in hits]
+        messages = ArchivedMessage.objects.select_related('sender', 'chat_room').in_bulk(ids)
+        messages.update(Message.objects.select_related('sender', 'chat_room').in_bulk(ids))
+        results = []
+        for pk, snippet in hits:
+            if pk in messages:
+                item = self.get_serializer(messages[pk]).data
+                item['snippet'] = snippet
+                results.append(item)
+        return Response({
+            'results': results,
+            'next_cursor': hits[-1][0] if has_more else None,
+        })
+
     @action(detail=False, methods=['post'])
     def mark_as_read(self, request):
         """
@@ -111,6 +185,6 @@ class MessageViewSet(viewsets.ModelViewSet):
         Message.objects.filter(
             chat_room_id=chat_room_id,
             is_read=False
-        ).exclude(sender=request.user).update(is_read=True)
+        ).exclude(sender=request.user).update(is_read=True, updated_at=timezone.now())
 
         return Response({'status': 'Messages marked as read'}, status=status.HTTP_200_OK)
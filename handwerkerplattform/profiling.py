@@ -0,0 +1,148 @@
+import cProfile
+import io
+import json
+import logging
+import pstats
+import random
+import time
+import uuid
+from contextlib import ExitStack
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.admin.views.decorators import staff_member_required
+from django.db import connections
+from django.http import Http404
+from django.shortcuts import render
+
+PROFILE_HEADER = 'HTTP_X_PROFILE'
+
+logger = logging.getLogger(__name__)
+
+
+def _profile_dir():
+    path = Path(getattr(settings, 'PROFILING_DIR', settings.BASE_DIR / 'profiles'))
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _is_staff(request):
+    """Staff check that also covers token auth (DRF authenticates only in the view)"""
+    if getattr(request, 'user', None) is not None and request.user.is_staff:
+        return True
+    from rest_framework.authentication import TokenAuthentication
+    from rest_framework.exceptions import AuthenticationFailed
+    from rest_framework.request import Request
+    try:
+        result = TokenAuthentication().authenticate(Request(request))
+    except AuthenticationFailed:
+        return False
+    return bool(result and result[0].is_staff)
+
+
+class SQLTrace:
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append({
+                'alias': context['connection'].alias,
+                'sql': sql,
+                'duration_ms': round((time.perf_counter() - start) * 1000, 3),
+            })
+
+
+class ProfilingMiddleware:
+    """
+    Opt-in per-request profiling. Triggered by staff users with the
+    `X-Profile: 1` header or for a PROFILING_SAMPLE_RATE fraction of requests.
+    Stores a cProfile dump plus the SQL trace in a bounded on-disk ring buffer
+    (PROFILING_MAX_ENTRIES), browsable at /admin/profiles/.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, 'PROFILING_SAMPLE_RATE', 0.0)
+
+    def __call__(self, request):
+        if not self.should_profile(request):
+            return self.get_response(request)
+
+        trace = SQLTrace()
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(trace))
+            profiler.enable()
+            try:
+                response = self.get_response(request)
+            finally:
+                profiler.disable()
+        self.store(request, response, profiler, trace, time.perf_counter() - start)
+        return response
+
+    def should_profile(self, request):
+        if request.META.get(PROFILE_HEADER) == '1':
+            return _is_staff(request)
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def store(self, request, response, profiler, trace, elapsed):
+        # Ein Fehler beim Ablegen des Profils darf die eigentliche Antwort nicht kippen
+        try:
+            self.write_entry(request, response, profiler, trace, elapsed)
+        except Exception:
+            logger.exception("Storing the profile for %s %s failed", request.method, request.path)
+
+    def write_entry(self, request, response, profiler, trace, elapsed):
+        directory = _profile_dir()
+        entry_id = f"{time.time_ns()}-{uuid.uuid4().hex[:8]}"
+        profiler.dump_stats(directory / f"{entry_id}.prof")
+
+        stats_text = io.StringIO()
+        pstats.Stats(profiler, stream=stats_text).sort_stats('cumulative').print_stats(60)
+        (directory / f"{entry_id}.json").write_text(json.dumps({
+            'id': entry_id,
+            'method': request.method,
+            'path': request.get_full_path(),
+            'status': response.status_code,
+            'duration_ms': round(elapsed * 1000, 3),
+            'sql_count': len(trace.queries),
+            'sql_ms': round(sum(q['duration_ms'] for q in trace.queries), 3),
+            'queries': trace.queries,
+            'stats': stats_text.getvalue(),
+        }))
+
+        # Ringpuffer: älteste Einträge verwerfen
+        entries = sorted(directory.glob('*.json'))
+        max_entries = getattr(settings, 'PROFILING_MAX_ENTRIES', 50)
+        for old in entries[:max(len(entries) - max_entries, 0)]:
+            old.unlink(missing_ok=True)
+            old.with_suffix('.prof').unlink(missing_ok=True)
+
+
+def _load(path):
+    """Entry as dict, None if it was trimmed from the ring buffer meanwhile or is unreadable"""
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+@staff_member_required
+def profile_list(request):
+    entries = [entry for entry in map(_load, sorted(_profile_dir().glob('*.json'), reverse=True)) if entry]
+    return render(request, 'admin/profiling/list.html', {'entries': entries, 'title': 'Request-Profile'})
+
+
+@staff_member_required
+def profile_detail(request, entry_id):
+    path = _profile_dir() / f"{entry_id}.json"
+    entry = None if '/' in entry_id else _load(path)
+    if entry is None:
+        raise Http404
+    return render(request, 'admin/profiling/detail.html', {'entry': entry, 'title': entry['path']})
@@ -28,6 +28,9 @@ INSTALLED_APPS = [
     "notifications.apps.NotificationsConfig",
     "chat.apps.ChatConfig",
     "users.apps.UsersConfig",
+    "sync.apps.SyncConfig",
+    "analytics.apps.AnalyticsConfig",
+    "archive.apps.ArchiveConfig",
     # "channels", # Entfernt
 ]
 
@@ -41,6 +44,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "handwerkerplattform.profiling.ProfilingMiddleware",
 ]
 
 CORS_ALLOWED_ORIGINS = [
@@ -84,6 +88,42 @@ if DATABASES['default'].get('ENGINE') == 'django.db.backends.mysql':
     DATABASES['default'].setdefault('OPTIONS', {})
     DATABASES['default']['OPTIONS'].setdefault('init_command', "SET sql_mode='STRICT_TRANS_TABLES'")
 
+# SQLite-Produktionsprofil: WAL, getunte Pragmas und BEGIN IMMEDIATE für Schreibtransaktionen,
+# damit parallele gunicorn-Worker nicht in "database is locked" laufen.
+# Aktiv außerhalb von DEBUG oder explizit mit SQLITE_PROFILE=production.
+SQLITE_PRAGMAS = [
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA temp_store=MEMORY",
+]
+if DATABASES['default'].get('ENGINE') == 'django.db.backends.sqlite3':
+    if os.environ.get('SQLITE_PROFILE', 'default' if DEBUG else 'production') == 'production':
+        DATABASES['default'].setdefault('OPTIONS', {})
+        DATABASES['default']['OPTIONS'].setdefault('init_command', ";".join(SQLITE_PRAGMAS))
+        DATABASES['default']['OPTIONS'].setdefault('transaction_mode', 'IMMEDIATE')
+        DATABASES['default']['OPTIONS'].setdefault('timeout', 5)
+
+# Geteilter Cache (z.B. für die Liste offener Angebote); Redis wenn konfiguriert.
+# Ohne REDIS_URL ist der Cache pro Prozess, der Listen-Cache bleibt dann aus.
+REDIS_URL = os.environ.get('REDIS_URL')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'handwerkerplattform',
+        }
+    }
+
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
     {"NAME": "django.contrib.auth.password_validation.MinimumLengthValidator"},
@@ -112,3 +152,24 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.IsAuthenticated',
     ],
 }
+
+# Maximale Anzahl Teilanfragen für /api/batch/
+BATCH_MAX_REQUESTS = int(os.environ.get('BATCH_MAX_REQUESTS', 10))
+
+# Profiling einzelner Requests (Header "X-Profile: 1" für Staff oder Stichprobe)
+PROFILING_SAMPLE_RATE = float(os.environ.get('PROFILING_SAMPLE_RATE', 0))
+PROFILING_MAX_ENTRIES = int(os.environ.get('PROFILING_MAX_ENTRIES', 50))
+PROFILING_DIR = os.environ.get('PROFILING_DIR', os.path.join(BASE_DIR, 'profiles'))
+
+# Marktkennzahlen: Anzahl PLZ-Stellen pro Region
+ANALYTICS_PLZ_PREFIX = int(os.environ.get('ANALYTICS_PLZ_PREFIX', 2))
+
+# Archivierung kalter Daten (manage.py archive_cold_data)
+ARCHIVE_NOTIFICATION_DAYS = int(os.environ.get('ARCHIVE_NOTIFICATION_DAYS', 90))
+ARCHIVE_CHAT_DAYS = int(os.environ.get('ARCHIVE_CHAT_DAYS', 180))
+ARCHIVE_INQUIRY_DAYS = int(os.environ.get('ARCHIVE_INQUIRY_DAYS', 180))
+ARCHIVE_BATCH_SIZE = int(os.environ.get('ARCHIVE_BATCH_SIZE', 1000))
+
+# Delta-Sync: Zeilen pro Modell und Seite, Aufbewahrung der Tombstones
+SYNC_PAGE_SIZE = int(os.environ.get('SYNC_PAGE_SIZE', 500))
+SYNC_TOMBSTONE_RETENTION_DAYS = int(os.environ.get('SYNC_TOMBSTONE_RETENTION_DAYS', 30))
@@ -0,0 +1,121 @@
+import tempfile
+from pathlib import Path
+
+from django.contrib import admin
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import include, path
+from rest_framework.authtoken.models import Token
+from rest_framework.response import Response
+from rest_framework.test import APIClient
+from rest_framework.views import APIView
+
+from users.models import User
+from .profiling import ProfilingMiddleware, profile_detail, profile_list
+from .views import BatchView
+
+
+class WhoAmIView(APIView):
+    def get(self, request):
+        return Response({'email': request.user.email})
+
+
+class BrokenView(APIView):
+    def get(self, request):
+        raise ValueError('kaputt')
+
+
+urlpatterns = [
+    path('admin/profiles/', profile_list, name='profile-list'),
+    path('admin/profiles/<str:entry_id>/', profile_detail, name='profile-detail'),
+    path('admin/', admin.site.urls),
+    path('api/', include(([
+        path('me/', WhoAmIView.as_view()),
+        path('broken/', BrokenView.as_view()),
+        path('batch/', BatchView.as_view()),
+    ], 'api'), namespace='api')),
+]
+
+
+@override_settings(ROOT_URLCONF=__name__, BATCH_MAX_REQUESTS=3)
+class BatchViewTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('kunde@example.com', 'pw')
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=self.user).key}')
+
+    def batch(self, *paths):
+        return self.client.post('/api/batch/', {'requests': [{'path': p} for p in paths]}, format='json')
+
+    def test_sub_requests_share_authenticated_user(self):
+        response = self.batch('/api/me/', '/api/me/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([r['body'] for r in response.data['responses']], [{'email': 'kunde@example.com'}] * 2)
+
+    def test_failing_sub_request_does_not_fail_batch(self):
+        response = self.batch('/api/me/', '/api/broken/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([r['status'] for r in response.data['responses']], [200, 500])
+
+    def test_only_api_routes_are_dispatched(self):
+        response = self.batch('/admin/', '/api/batch/')
+        self.assertEqual([r['status'] for r in response.data['responses']], [404, 400])
+
+    def test_max_batch_size(self):
+        self.assertEqual(self.batch(*['/api/me/'] * 4).status_code, 400)
+
+
+class ProfilingMiddlewareTests(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.staff = User.objects.create_user('staff@example.com', 'pw', is_staff=True)
+        self.user = User.objects.create_user('nutzer@example.com', 'pw')
+
+    def request(self, user, **headers):
+        request = RequestFactory().get('/api/offers/', **headers)
+        request.user = user
+        return request
+
+    def run_profiled(self, count=1, **settings):
+        settings.setdefault('PROFILING_DIR', self.directory.name)
+        with override_settings(**settings):
+            middleware = ProfilingMiddleware(lambda request: HttpResponse('ok'))
+            return [middleware(self.request(self.staff, HTTP_X_PROFILE='1')) for _ in range(count)]
+
+    def test_trigger(self):
+        middleware = ProfilingMiddleware(lambda request: HttpResponse('ok'))
+        self.assertTrue(middleware.should_profile(self.request(self.staff, HTTP_X_PROFILE='1')))
+        self.assertFalse(middleware.should_profile(self.request(self.user, HTTP_X_PROFILE='1')))
+        self.assertFalse(middleware.should_profile(self.request(AnonymousUser(), HTTP_X_PROFILE='1')))
+        self.assertFalse(middleware.should_profile(self.request(self.staff)))
+        with override_settings(PROFILING_SAMPLE_RATE=1.0):
+            sampled = ProfilingMiddleware(lambda request: HttpResponse('ok'))
+        self.assertTrue(sampled.should_profile(self.request(AnonymousUser())))
+
+    def test_ring_buffer_keeps_newest_entries(self):
+        self.run_profiled(count=3, PROFILING_MAX_ENTRIES=2)
+        directory = Path(self.directory.name)
+        self.assertEqual(len(list(directory.glob('*.json'))), 2)
+        self.assertEqual(len(list(directory.glob('*.prof'))), 2)
+
+    def test_storage_errors_do_not_fail_the_request(self):
+        blocker = Path(self.directory.name) / 'datei'
+        blocker.write_text('')
+        with self.assertLogs('handwerkerplattform.profiling', level='ERROR'):
+            response, = self.run_profiled(PROFILING_DIR=str(blocker / 'profiles'))
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(ROOT_URLCONF=__name__)
+    def test_browser_is_staff_only(self):
+        with override_settings(PROFILING_DIR=self.directory.name):
+            self.run_profiled()
+            entry_id = next(Path(self.directory.name).glob('*.json')).stem
+            self.client.force_login(self.user)
+            self.assertEqual(self.client.get('/admin/profiles/').status_code, 302)
+            self.assertEqual(self.client.get(f'/admin/profiles/{entry_id}/').status_code, 302)
+            self.client.force_login(self.staff)
+            self.assertContains(self.client.get('/admin/profiles/'), entry_id)
+            self.assertEqual(self.client.get(f'/admin/profiles/{entry_id}/').status_code, 200)
+            self.assertEqual(self.client.get('/admin/profiles/fehlt/').status_code, 404)
@@ -4,6 +4,9 @@ from rest_framework import permissions
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 
+from .views import BatchView
+from .profiling import profile_list, profile_detail
+
 # Zurückgesetzt auf eine einfache, stabile Konfiguration
 schema_view = get_schema_view(
    openapi.Info(
@@ -16,6 +19,9 @@ schema_view = get_schema_view(
 )
 
 urlpatterns = [
+    # Request-Profile (nur Staff), vor admin.site.urls damit sie nicht vom Admin abgefangen werden
+    path("admin/profiles/", profile_list, name="profile-list"),
+    path("admin/profiles/<str:entry_id>/", profile_detail, name="profile-detail"),
     path("admin/", admin.site.urls),
     
     # URLs für die API-Dokumentation
@@ -28,5 +34,8 @@ urlpatterns = [
         path('', include('jobs.urls')),
         path('', include('chat.urls')),
         path('', include('notifications.urls')),
+        path('', include('sync.urls')),
+        path('', include('analytics.urls')),
+        path('batch/', BatchView.as_view(), name='batch'),
     ], 'api'), namespace='api')),
 ]
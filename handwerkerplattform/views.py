@@ -0,0 +1,77 @@
+import json
+import logging
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.test import RequestFactory
+from django.urls import resolve, Resolver404
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+BATCH_METHODS = {'GET', 'POST', 'PUT', 'PATCH', 'DELETE'}
+
+logger = logging.getLogger(__name__)
+
+
+class BatchView(APIView):
+    """
+    Dispatch several API calls in one round trip
+    POST /api/batch/
+    Body: {"requests": [{"method": "GET", "path": "/api/users/me/"}, ...]}
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        sub_requests = request.data.get('requests')
+        if not isinstance(sub_requests, list) or not sub_requests:
+            return Response({'error': 'requests (Liste) ist erforderlich.'}, status=status.HTTP_400_BAD_REQUEST)
+        max_size = getattr(settings, 'BATCH_MAX_REQUESTS', 10)
+        if len(sub_requests) > max_size:
+            return Response({'error': f'Maximal {max_size} Anfragen pro Batch.'}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({'responses': [self.dispatch_sub_request(request, sub) for sub in sub_requests]})
+
+    def dispatch_sub_request(self, request, sub):
+        if not isinstance(sub, dict):
+            return {'status': status.HTTP_400_BAD_REQUEST, 'body': {'error': 'Ungültige Anfrage.'}}
+        method = str(sub.get('method', 'GET')).upper()
+        url = str(sub.get('path', ''))
+        path = urlsplit(url).path
+        if method not in BATCH_METHODS:
+            return {'path': url, 'status': status.HTTP_405_METHOD_NOT_ALLOWED, 'body': {'error': 'Methode nicht erlaubt.'}}
+        try:
+            match = resolve(path)
+        except Resolver404:
+            return {'path': url, 'status': status.HTTP_404_NOT_FOUND, 'body': {'error': 'Nicht gefunden.'}}
+        # Nur API-Routen; Admin, Profiling und Swagger sind nicht per Batch erreichbar
+        if 'api' not in match.namespaces:
+            return {'path': url, 'status': status.HTTP_404_NOT_FOUND, 'body': {'error': 'Nicht gefunden.'}}
+        if getattr(match.func, 'view_class', None) is BatchView:
+            return {'path': url, 'status': status.HTTP_400_BAD_REQUEST, 'body': {'error': 'Verschachtelte Batches sind nicht erlaubt.'}}
+
+        factory = RequestFactory()
+        body = sub.get('body')
+        if method == 'GET':
+            sub_request = factory.get(url, HTTP_HOST=request.get_host())
+        else:
+            sub_request = factory.generic(
+                method, url, json.dumps(body or {}), content_type='application/json', HTTP_HOST=request.get_host(),
+            )
+        # Bereits authentifizierten Benutzer weiterreichen statt erneut zu authentifizieren
+        sub_request._force_auth_user = request.user
+        sub_request._force_auth_token = request.auth
+        sub_request.user = request.user
+
+        try:
+            response = match.func(sub_request, *match.args, **match.kwargs)
+            if hasattr(response, 'render'):
+                response.render()
+        except Exception:
+            # Ein Fehler in einer Teilanfrage darf nicht den ganzen Batch abbrechen
+            logger.exception("Batch sub-request %s %s failed", method, url)
+            return {'path': url, 'status': status.HTTP_500_INTERNAL_SERVER_ERROR, 'body': {'error': 'Interner Fehler.'}}
+        if response.get('Content-Type', '').startswith('application/json') and response.content:
+            payload = json.loads(response.content)
+        else:
+            payload = response.content.decode(response.charset or 'utf-8')
+        return {'path': url, 'status': response.status_code, 'body': payload}
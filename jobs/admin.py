@@ -1,6 +1,35 @@
 from django.contrib import admin
-from .models import Offer, Inquiry, Review
+from .models import Offer, Inquiry, Review, OfferCard
 
-admin.site.register(Offer)
-admin.site.register(Inquiry)
-admin.site.register(Review)
+
+@admin.register(Offer)
+class OfferAdmin(admin.ModelAdmin):
+    list_display = ('id', 'title', 'craftsman', 'trade', 'zip_code', 'status', 'created_at')
+    list_select_related = ('craftsman',)
+    list_filter = ('status',)
+    search_fields = ('=id', 'title')
+    autocomplete_fields = ('craftsman',)
+    show_full_result_count = False
+
+
+@admin.register(Inquiry)
+class InquiryAdmin(admin.ModelAdmin):
+    list_display = ('id', 'offer', 'customer', 'status', 'created_at')
+    list_select_related = ('offer', 'customer')
+    list_filter = ('status',)
+    autocomplete_fields = ('offer', 'customer')
+    show_full_result_count = False
+
+
+@admin.register(Review)
+class ReviewAdmin(admin.ModelAdmin):
+    list_display = ('id', 'offer', 'rating', 'created_at')
+    list_select_related = ('offer',)
+    autocomplete_fields = ('offer',)
+
+
+@admin.register(OfferCard)
+class OfferCardAdmin(admin.ModelAdmin):
+    list_display = ('offer_id', 'title', 'company_name', 'status', 'average_rating', 'inquiry_count', 'chat_count')
+    list_filter = ('status', 'is_verified')
+    show_full_result_count = False
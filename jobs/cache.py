@@ -0,0 +1,140 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+OPEN_OFFERS_VERSION_KEY = 'offers:open:version'
+OPEN_OFFERS_TTL = 300
+LOCAL_CACHE_TTL = 5
+LOCAL_CACHE_SIZE = 256
+LOCK_TIMEOUT = 10
+LOCK_WAIT = 5
+
+
+class LocalLRUCache:
+    """
+    Small in-process LRU with per-entry TTL (first cache tier)
+    """
+
+    def __init__(self, maxsize=LOCAL_CACHE_SIZE, ttl=LOCAL_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires, value = item
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+local_cache = LocalLRUCache()
+_flight_locks = {}
+_flight_locks_guard = threading.Lock()
+
+
+def _flight_lock(key):
+    with _flight_locks_guard:
+        return _flight_locks.setdefault(key, threading.Lock())
+
+
+def shared_cache_available():
+    """
+    The listing cache relies on one version counter for all workers. A
+    per-process backend (LocMem, Dummy) would keep other workers on a stale
+    version, so the cache stays off unless Redis, Memcached or the database
+    cache is configured.
+    """
+    return not isinstance(caches['default'], (LocMemCache, DummyCache))
+
+
+def get_open_offers_version():
+    version = cache.get(OPEN_OFFERS_VERSION_KEY)
+    if version is None:
+        cache.add(OPEN_OFFERS_VERSION_KEY, 1, timeout=None)
+        version = cache.get(OPEN_OFFERS_VERSION_KEY, 1)
+    return version
+
+
+def invalidate_open_offers():
+    """
+    Bump the listing version so every cached filter combination becomes stale
+    """
+    try:
+        cache.incr(OPEN_OFFERS_VERSION_KEY)
+    except ValueError:
+        cache.set(OPEN_OFFERS_VERSION_KEY, 2, timeout=None)
+
+
+def open_offers_key(params):
+    """
+    Build a versioned cache key for one filter combination (query params)
+    """
+    raw = '&'.join(f'{k}={v}' for k, v in sorted(params.lists()) if k != 'format')
+    digest = hashlib.md5(raw.encode('utf-8')).hexdigest()
+    return f'offers:open:v{get_open_offers_version()}:{digest}'
+
+
+def get_or_compute(key, compute):
+    """
+    Read through the local LRU and the shared cache. On a miss only one caller
+    recomputes: threads in this process share a lock, other processes wait on a
+    short-lived lock key in the shared cache.
+    """
+    value = local_cache.get(key)
+    if value is not None:
+        return value
+
+    with _flight_lock(key):
+        value = local_cache.get(key)
+        if value is not None:
+            return value
+        value = cache.get(key)
+        if value is None:
+            value = _compute_once(key, compute)
+        local_cache.set(key, value)
+    with _flight_locks_guard:
+        _flight_locks.pop(key, None)
+    return value
+
+
+def _compute_once(key, compute):
+    lock_key = f'{key}:lock'
+    acquired = cache.add(lock_key, 1, timeout=LOCK_TIMEOUT)
+    if not acquired:
+        deadline = time.monotonic() + LOCK_WAIT
+        while time.monotonic() < deadline:
+            time.sleep(0.05)
+            value = cache.get(key)
+            if value is not None:
+                return value
+    try:
+        value = compute()
+        cache.set(key, value, timeout=OPEN_OFFERS_TTL)
+        return value
+    finally:
+        # Nur die eigene Sperre freigeben, nie die eines anderen Prozesses
+        if acquired:
+            cache.delete(lock_key)
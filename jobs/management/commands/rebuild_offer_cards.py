@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+from django.forms.models import model_to_dict
+
+from jobs.models import Offer, OfferCard
+from jobs.read_model import CARD_FIELDS, build_offer_cards, save_offer_cards
+
+
+class Command(BaseCommand):
+    help = "Baut das Lesemodell der Angebotskarten neu auf bzw. prüft es (--check)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--check', action='store_true', help="Nur Abweichungen melden, nichts schreiben.")
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        ids = list(Offer.objects.order_by('pk').values_list('pk', flat=True))
+        mismatched = 0
+        for start in range(0, len(ids), batch_size):
+            batch = ids[start:start + batch_size]
+            fresh = build_offer_cards(Offer.objects.filter(pk__in=batch))
+            existing = OfferCard.objects.in_bulk(batch)
+            stale = [
+                card for card in fresh
+                if card.pk not in existing
+                or model_to_dict(existing[card.pk], CARD_FIELDS) != model_to_dict(card, CARD_FIELDS)
+            ]
+            mismatched += len(stale)
+            if not options['check']:
+                save_offer_cards(stale)
+
+        orphans = OfferCard.objects.exclude(offer__in=Offer.objects.all())
+        orphan_count = orphans.count()
+        if not options['check']:
+            orphans.delete()
+
+        verb = "abweichend" if options['check'] else "aktualisiert"
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(ids)} Angebote geprüft, {mismatched} Karten {verb}, {orphan_count} verwaiste Karten."
+        ))
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:27
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Inquiry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('SUBMITTED', 'Eingereicht'), ('ACCEPTED', 'Angenommen'), ('REJECTED', 'Abgelehnt')], default='SUBMITTED', max_length=20, verbose_name='Anfragenstatus')),
+                ('cover_letter', models.TextField(blank=True, verbose_name='Anschreiben')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Offer',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=255, verbose_name='Titel')),
+                ('description', models.TextField(verbose_name='Beschreibung')),
+                ('trade', models.CharField(max_length=100, verbose_name='Gewerbe')),
+                ('zip_code', models.CharField(max_length=10, verbose_name='PLZ')),
+                ('status', models.CharField(choices=[('OPEN', 'Offen'), ('IN_PROGRESS', 'In Arbeit'), ('COMPLETED', 'Abgeschlossen')], default='OPEN', max_length=20, verbose_name='Status')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Review',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rating', models.PositiveIntegerField(validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(5)], verbose_name='Bewertung (1-5 Sterne)')),
+                ('comment', models.TextField(blank=True, verbose_name='Kommentar')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
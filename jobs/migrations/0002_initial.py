@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:27
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('jobs', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='inquiry',
+            name='customer',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='inquiries', to=settings.AUTH_USER_MODEL, verbose_name='Kunde'),
+        ),
+        migrations.AddField(
+            model_name='offer',
+            name='craftsman',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='offers_created', to=settings.AUTH_USER_MODEL, verbose_name='Handwerker'),
+        ),
+        migrations.AddField(
+            model_name='inquiry',
+            name='offer',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='inquiries', to='jobs.offer', verbose_name='Angebot'),
+        ),
+        migrations.AddField(
+            model_name='review',
+            name='offer',
+            field=models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='review', to='jobs.offer', verbose_name='Angebot'),
+        ),
+        migrations.AddConstraint(
+            model_name='inquiry',
+            constraint=models.UniqueConstraint(fields=('offer', 'customer'), name='unique_offer_inquiry'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:28
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0003_sync_tombstones'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OfferCard',
+            fields=[
+                ('offer', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='card', serialize=False, to='jobs.offer')),
+                ('title', models.CharField(max_length=255)),
+                ('trade', models.CharField(max_length=100)),
+                ('zip_code', models.CharField(max_length=10)),
+                ('status', models.CharField(choices=[('OPEN', 'Offen'), ('IN_PROGRESS', 'In Arbeit'), ('COMPLETED', 'Abgeschlossen')], max_length=20)),
+                ('company_name', models.CharField(blank=True, max_length=255)),
+                ('is_verified', models.BooleanField(default=False)),
+                ('average_rating', models.FloatField(blank=True, null=True)),
+                ('review_count', models.PositiveIntegerField(default=0)),
+                ('inquiry_count', models.PositiveIntegerField(default=0)),
+                ('chat_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('craftsman', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='offer_cards', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', '-created_at'], name='jobs_offerc_status_e7a8ef_idx'), models.Index(fields=['craftsman', '-created_at'], name='jobs_offerc_craftsm_de94e9_idx')],
+            },
+        ),
+    ]
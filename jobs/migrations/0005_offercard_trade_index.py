@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:28
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0004_offercard'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='offercard',
+            index=models.Index(fields=['status', 'trade', '-created_at'], name='jobs_offerc_status_318075_idx'),
+        ),
+    ]
@@ -21,7 +21,7 @@ class Offer(models.Model):
     zip_code = models.CharField(max_length=10, verbose_name="PLZ")
     status = models.CharField(max_length=20, choices=JobStatus.choices, default=JobStatus.OPEN, verbose_name="Status")
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     def __str__(self):
         return f"'{self.title}'"
@@ -43,6 +43,7 @@ class Inquiry(models.Model):
     status = models.CharField(max_length=20, choices=ApplicationStatus.choices, default=ApplicationStatus.SUBMITTED, verbose_name="Anfragenstatus")
     cover_letter = models.TextField(blank=True, verbose_name="Anschreiben")
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     class Meta:
         constraints = [models.UniqueConstraint(fields=['offer', 'customer'], name='unique_offer_inquiry')]
@@ -62,4 +63,40 @@ class Review(models.Model):
         ordering = ['-created_at']
 
     def __str__(self):
-        return f"{self.rating}-Sterne Bewertung für Angebot '{self.offer.title}'"
\ No newline at end of file
+        return f"{self.rating}-Sterne Bewertung für Angebot '{self.offer.title}'"
+
+
+class OfferCard(models.Model):
+    """
+    Denormalized read model for offer list cards (one row per offer).
+    Maintained by signals in jobs.signals, rebuilt with `manage.py rebuild_offer_cards`.
+    """
+    offer = models.OneToOneField(Offer, on_delete=models.CASCADE, primary_key=True, related_name="card")
+    craftsman = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="offer_cards",
+    )
+    title = models.CharField(max_length=255)
+    trade = models.CharField(max_length=100)
+    zip_code = models.CharField(max_length=10)
+    status = models.CharField(max_length=20, choices=Offer.JobStatus.choices)
+    company_name = models.CharField(max_length=255, blank=True)
+    is_verified = models.BooleanField(default=False)
+    average_rating = models.FloatField(null=True, blank=True)
+    review_count = models.PositiveIntegerField(default=0)
+    inquiry_count = models.PositiveIntegerField(default=0)
+    chat_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', '-created_at']),
+            models.Index(fields=['status', 'trade', '-created_at']),
+            models.Index(fields=['craftsman', '-created_at']),
+        ]
+
+    def __str__(self):
+        return f"Karte für '{self.title}'"
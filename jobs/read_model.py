@@ -0,0 +1,104 @@
+from django.db import connection
+from django.db.models import Avg, Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from rest_framework import serializers
+from rest_framework.pagination import CursorPagination
+
+from archive.models import ArchivedChatRoom, ArchivedInquiry
+from chat.models import ChatRoom
+from .models import Offer, OfferCard, Review, Inquiry
+
+CARD_FIELDS = [
+    'craftsman', 'title', 'trade', 'zip_code', 'status', 'company_name', 'is_verified',
+    'average_rating', 'review_count', 'inquiry_count', 'chat_count', 'created_at', 'updated_at',
+]
+
+
+def craftsman_ratings(craftsman_ids):
+    """{craftsman_id: (average_rating, review_count)} over all reviews of their offers"""
+    rows = (
+        Review.objects.filter(offer__craftsman_id__in=craftsman_ids)
+        .values('offer__craftsman_id')
+        .annotate(average=Avg('rating'), total=Count('id'))
+    )
+    return {row['offer__craftsman_id']: (row['average'], row['total']) for row in rows}
+
+
+def _count_per_offer(model, field):
+    rows = model.objects.filter(**{field: OuterRef('pk')}).order_by().values(field).annotate(n=Count('pk')).values('n')
+    return Coalesce(Subquery(rows), 0)
+
+
+def build_offer_cards(offers):
+    """Compute fresh OfferCard instances for the given Offer queryset"""
+    offers = list(
+        offers.select_related('craftsman__craftsman_profile')
+        # Archivierte Anfragen/Chats zählen weiter mit, sonst ändert die Archivierung die Karten
+        .annotate(
+            num_inquiries=_count_per_offer(Inquiry, 'offer') + _count_per_offer(ArchivedInquiry, 'offer'),
+            num_chats=_count_per_offer(ChatRoom, 'job') + _count_per_offer(ArchivedChatRoom, 'job'),
+        )
+        .order_by()
+    )
+    ratings = craftsman_ratings({offer.craftsman_id for offer in offers})
+    cards = []
+    for offer in offers:
+        profile = getattr(offer.craftsman, 'craftsman_profile', None)
+        average, total = ratings.get(offer.craftsman_id, (None, 0))
+        cards.append(OfferCard(
+            offer=offer,
+            craftsman_id=offer.craftsman_id,
+            title=offer.title,
+            trade=offer.trade,
+            zip_code=offer.zip_code,
+            status=offer.status,
+            company_name=profile.company_name if profile else '',
+            is_verified=profile.is_verified if profile else False,
+            average_rating=average,
+            review_count=total,
+            inquiry_count=offer.num_inquiries,
+            chat_count=offer.num_chats,
+            created_at=offer.created_at,
+            updated_at=offer.updated_at,
+        ))
+    return cards
+
+
+def save_offer_cards(cards):
+    if not cards:
+        return
+    kwargs = {'update_conflicts': True, 'update_fields': CARD_FIELDS}
+    if connection.features.supports_update_conflicts_with_target:
+        kwargs['unique_fields'] = ['offer']
+    OfferCard.objects.bulk_create(cards, **kwargs)
+
+
+def refresh_offer_cards(offer_ids):
+    save_offer_cards(build_offer_cards(Offer.objects.filter(pk__in=offer_ids)))
+
+
+def refresh_craftsman_rating(craftsman_id):
+    average, total = craftsman_ratings([craftsman_id]).get(craftsman_id, (None, 0))
+    OfferCard.objects.filter(craftsman_id=craftsman_id).update(average_rating=average, review_count=total)
+
+
+def refresh_craftsman_profile(profile):
+    OfferCard.objects.filter(craftsman_id=profile.user_id).update(
+        company_name=profile.company_name, is_verified=profile.is_verified,
+    )
+
+
+class OfferCardSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = OfferCard
+        fields = [
+            'offer', 'craftsman', 'title', 'trade', 'zip_code', 'status', 'company_name', 'is_verified',
+            'average_rating', 'review_count', 'inquiry_count', 'chat_count', 'created_at', 'updated_at',
+        ]
+
+
+class OfferCardPagination(CursorPagination):
+    ordering = '-created_at'
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
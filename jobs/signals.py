@@ -0,0 +1,48 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from chat.models import ChatRoom
+from users.models import CraftsmanProfile
+from .cache import invalidate_open_offers
+from .models import Offer, Inquiry, Review
+from .read_model import refresh_offer_cards, refresh_craftsman_rating, refresh_craftsman_profile
+
+
+@receiver(post_save, sender=Offer)
+@receiver(post_delete, sender=Offer)
+def offer_changed(sender, instance, **kwargs):
+    """
+    Any saved or deleted offer (incl. status changes) invalidates the open-offer listing.
+    Deferred to commit so no stale listing is cached under the new version.
+    """
+    transaction.on_commit(invalidate_open_offers)
+
+
+# Lesemodell erst nach dem Commit aktualisieren: so sehen Kaskaden-Löschungen
+# (Offer -> Inquiry/ChatRoom) ein bereits gelöschtes Angebot und legen keine Karte neu an.
+
+@receiver(post_save, sender=Offer)
+def offer_saved(sender, instance, **kwargs):
+    transaction.on_commit(lambda: refresh_offer_cards([instance.pk]))
+
+
+@receiver(post_save, sender=Inquiry)
+@receiver(post_delete, sender=Inquiry)
+@receiver(post_save, sender=ChatRoom)
+@receiver(post_delete, sender=ChatRoom)
+def offer_counts_changed(sender, instance, **kwargs):
+    offer_id = instance.offer_id if sender is Inquiry else instance.job_id
+    transaction.on_commit(lambda: refresh_offer_cards([offer_id]))
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def review_changed(sender, instance, **kwargs):
+    for craftsman_id in Offer.objects.filter(pk=instance.offer_id).values_list('craftsman_id', flat=True):
+        transaction.on_commit(lambda craftsman_id=craftsman_id: refresh_craftsman_rating(craftsman_id))
+
+
+@receiver(post_save, sender=CraftsmanProfile)
+def craftsman_profile_saved(sender, instance, **kwargs):
+    transaction.on_commit(lambda: refresh_craftsman_profile(instance))
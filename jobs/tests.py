@@ -1,3 +1,109 @@
-from django.test import TestCase
+import threading
+import time
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from users.models import User
+from . import cache as offer_cache
+from .models import Offer, OfferCard
+from .read_model import OfferCardSerializer, OfferCardPagination
+
+
+class OpenOfferCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        offer_cache.local_cache.clear()
+        self.craftsman = User.objects.create_user('handwerker@example.com', 'pw', role=User.Role.CRAFTSMAN)
+
+    def create_offer(self, **kwargs):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Offer.objects.create(
+                craftsman=self.craftsman, title='Bad fliesen', description='-', trade='Fliesenleger', zip_code='10115',
+                **kwargs,
+            )
+
+    def test_status_change_bumps_version(self):
+        offer = self.create_offer()
+        version = offer_cache.get_open_offers_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            offer.status = Offer.JobStatus.IN_PROGRESS
+            offer.save()
+        self.assertEqual(offer_cache.get_open_offers_version(), version + 1)
+
+    def test_delete_bumps_version(self):
+        offer = self.create_offer()
+        version = offer_cache.get_open_offers_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            offer.delete()
+        self.assertEqual(offer_cache.get_open_offers_version(), version + 1)
+
+    def test_single_flight_computes_once(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.1)
+            return ['offer']
+
+        threads = [
+            threading.Thread(target=offer_cache.get_or_compute, args=('offers:test', compute)) for _ in range(10)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cache.get('offers:test'), ['offer'])
+
+    def test_foreign_lock_is_not_released(self):
+        cache.add('offers:busy:lock', 1)
+        with mock.patch.object(offer_cache, 'LOCK_WAIT', 0.1):
+            value = offer_cache.get_or_compute('offers:busy', lambda: ['fallback'])
+        self.assertEqual(value, ['fallback'])
+        self.assertEqual(cache.get('offers:busy:lock'), 1)
+
+    def test_per_process_cache_is_not_shared(self):
+        self.assertFalse(offer_cache.shared_cache_available())
+        backend = {'default': {'BACKEND': 'django.core.cache.backends.db.DatabaseCache', 'LOCATION': 'cache_table'}}
+        with override_settings(CACHES=backend):
+            self.assertTrue(offer_cache.shared_cache_available())
+
+
+class OfferCardTests(TestCase):
+    def setUp(self):
+        self.craftsman = User.objects.create_user('karte@example.com', 'pw', role=User.Role.CRAFTSMAN)
+
+    def create_offer(self, title='Bad fliesen'):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Offer.objects.create(
+                craftsman=self.craftsman, title=title, description='-', trade='Fliesenleger', zip_code='10115',
+            )
+
+    def test_card_follows_offer(self):
+        offer = self.create_offer()
+        self.assertEqual(OfferCard.objects.get(pk=offer.pk).title, 'Bad fliesen')
+        with self.captureOnCommitCallbacks(execute=True):
+            offer.title = 'Küche fliesen'
+            offer.save()
+        self.assertEqual(OfferCard.objects.get(pk=offer.pk).title, 'Küche fliesen')
+
+    def test_serializer_uses_local_time(self):
+        card = OfferCard.objects.get(pk=self.create_offer().pk)
+        data = OfferCardSerializer(card).data
+        self.assertEqual(data['created_at'], timezone.localtime(card.created_at).isoformat())
+
+    def test_pagination(self):
+        for i in range(3):
+            self.create_offer(title=f'Angebot {i}')
+        paginator = OfferCardPagination()
+        paginator.page_size = 2
+        request = Request(APIRequestFactory().get('/api/offers/cards/'))
+        page = paginator.paginate_queryset(OfferCard.objects.all(), request)
+        response = paginator.get_paginated_response(OfferCardSerializer(page, many=True).data)
+        self.assertEqual([c['title'] for c in response.data['results']], ['Angebot 2', 'Angebot 1'])
+        self.assertIsNotNone(response.data['next'])
@@ -1,14 +1,21 @@
 from django.db import transaction
+from django.utils import timezone
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
-from .models import Offer, Inquiry, Review
+from .cache import open_offers_key, get_or_compute, shared_cache_available
+from .read_model import OfferCardSerializer, OfferCardPagination
+from .models import Offer, Inquiry, Review, OfferCard
 from .serializers import OfferSerializer, InquirySerializer, ReviewSerializer
 from users.permissions import IsOwnerOrReadOnly, IsCustomer, IsCraftsman
+from users.fieldsets import SparseFieldsetMixin
+from analytics.rollups import record_inquiries_rejected
+from archive.mixins import ArchiveFallbackMixin
+from archive.models import ArchivedInquiry
 
 
-class ReviewViewSet(viewsets.ModelViewSet):
+class ReviewViewSet(SparseFieldsetMixin, viewsets.ModelViewSet):
     serializer_class = ReviewSerializer
     permission_classes = [permissions.IsAuthenticated]
 
@@ -37,7 +44,7 @@ class ReviewViewSet(viewsets.ModelViewSet):
         return Response(self.get_serializer(review).data, status=status.HTTP_201_CREATED)
 
 
-class OfferViewSet(viewsets.ModelViewSet):
+class OfferViewSet(SparseFieldsetMixin, viewsets.ModelViewSet):
     serializer_class = OfferSerializer
 
     def get_queryset(self):
@@ -60,9 +67,43 @@ class OfferViewSet(viewsets.ModelViewSet):
             self.permission_classes = [permissions.IsAuthenticated]
         return super().get_permissions()
 
+    def list(self, request, *args, **kwargs):
+        from users.models import User
+        if request.user.role != User.Role.CUSTOMER or not shared_cache_available():
+            return super().list(request, *args, **kwargs)
+        # Alle Kunden sehen dieselbe Liste offener Angebote -> geteilter Cache
+        key = open_offers_key(request.query_params)
+        data = get_or_compute(key, lambda: super(OfferViewSet, self).list(request, *args, **kwargs).data)
+        return Response(data)
+
     def perform_create(self, serializer):
         serializer.save(craftsman=self.request.user)
 
+    @action(detail=False, methods=['get'])
+    def cards(self, request):
+        """
+        Offer list cards from the denormalized read model (one indexed query)
+        GET /api/offers/cards/?trade=Elektriker&zip=10&status=OPEN&cursor=...
+        """
+        from users.models import User
+        params = request.query_params
+        if request.user.role == User.Role.CUSTOMER:
+            cards = OfferCard.objects.filter(status=Offer.JobStatus.OPEN)
+        elif request.user.role == User.Role.CRAFTSMAN:
+            cards = OfferCard.objects.filter(craftsman=request.user)
+            if params.get('status'):
+                cards = cards.filter(status=params['status'])
+        else:
+            cards = OfferCard.objects.none()
+        if params.get('trade'):
+            cards = cards.filter(trade=params['trade'])
+        if params.get('zip'):
+            cards = cards.filter(zip_code__startswith=params['zip'])
+
+        paginator = OfferCardPagination()
+        page = paginator.paginate_queryset(cards, request, view=self)
+        return paginator.get_paginated_response(OfferCardSerializer(page, many=True).data)
+
     @action(detail=True, methods=['post'])
     def complete(self, request, pk=None):
         offer = self.get_object()
@@ -75,8 +116,9 @@ class OfferViewSet(viewsets.ModelViewSet):
         return Response(OfferSerializer(offer).data)
 
 
-class InquiryViewSet(viewsets.ModelViewSet):
+class InquiryViewSet(ArchiveFallbackMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     serializer_class = InquirySerializer
+    archive_ordering = '-created_at'
 
     def get_queryset(self):
         user = self.request.user
@@ -89,6 +131,15 @@ class InquiryViewSet(viewsets.ModelViewSet):
             return Inquiry.objects.filter(offer__craftsman=user)
         return Inquiry.objects.none()
 
+    def get_archive_queryset(self):
+        user = self.request.user
+        from users.models import User
+        if user.role == User.Role.CUSTOMER:
+            return ArchivedInquiry.objects.filter(customer=user)
+        elif user.role == User.Role.CRAFTSMAN:
+            return ArchivedInquiry.objects.filter(offer__craftsman=user)
+        return ArchivedInquiry.objects.none()
+
     def get_permissions(self):
         if self.action == 'create':
             self.permission_classes = [permissions.IsAuthenticated, IsCustomer]
@@ -127,5 +178,6 @@ class InquiryViewSet(viewsets.ModelViewSet):
             inquiry.save()
             offer.status = Offer.JobStatus.IN_PROGRESS
             offer.save()
-            offer.inquiries.exclude(pk=inquiry.pk).update(status=Inquiry.ApplicationStatus.REJECTED)
+            rejected = offer.inquiries.exclude(pk=inquiry.pk).update(status=Inquiry.ApplicationStatus.REJECTED, updated_at=timezone.now())
+            record_inquiries_rejected(offer, rejected)
         return Response({'status': 'Anfrage akzeptiert. Angebot ist nun in Arbeit.'})
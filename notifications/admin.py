@@ -1,4 +1,11 @@
 from django.contrib import admin
 from .models import Notification
+from users.admin_mixins import LargeTableAdminMixin
 
-admin.site.register(Notification)
+
+@admin.register(Notification)
+class NotificationAdmin(LargeTableAdminMixin, admin.ModelAdmin):
+    list_display = ('id', 'user', 'notification_type', 'title', 'is_read', 'created_at')
+    list_select_related = ('user',)
+    list_filter = ('is_read', 'notification_type', ('created_at', admin.DateFieldListFilter))
+    autocomplete_fields = ('user',)
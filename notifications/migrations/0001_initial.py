@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Notification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('notification_type', models.CharField(choices=[('APPLICATION', 'Neue Bewerbung'), ('APPLICATION_ACCEPTED', 'Bewerbung angenommen'), ('APPLICATION_REJECTED', 'Bewerbung abgelehnt'), ('MESSAGE', 'Neue Nachricht'), ('JOB_COMPLETED', 'Auftrag abgeschlossen'), ('REVIEW', 'Neue Bewertung')], max_length=50)),
+                ('title', models.CharField(max_length=255)),
+                ('message', models.TextField()),
+                ('is_read', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('job_id', models.IntegerField(blank=True, null=True)),
+                ('application_id', models.IntegerField(blank=True, null=True)),
+                ('chat_room_id', models.IntegerField(blank=True, null=True)),
+                ('review_id', models.IntegerField(blank=True, null=True)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
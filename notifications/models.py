@@ -22,6 +22,7 @@ class Notification(models.Model):
     message = models.TextField()
     is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     # Optional links to related objects
     job_id = models.IntegerField(null=True, blank=True)
@@ -31,6 +32,12 @@ class Notification(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', 'is_read']),
+            models.Index(fields=['created_at']),
+            models.Index(fields=['is_read', 'created_at']),
+            models.Index(fields=['notification_type', 'created_at']),
+        ]
 
     def __str__(self):
         return f"{self.user.email} - {self.title}"
\ No newline at end of file
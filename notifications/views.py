@@ -1,18 +1,26 @@
+from django.utils import timezone
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from .models import Notification
 from .serializers import NotificationSerializer
+from users.fieldsets import SparseFieldsetMixin
+from archive.mixins import ArchiveFallbackMixin
+from archive.models import ArchivedNotification
 
 
-class NotificationViewSet(viewsets.ModelViewSet):
+class NotificationViewSet(ArchiveFallbackMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     serializer_class = NotificationSerializer
     permission_classes = [IsAuthenticated]
+    archive_ordering = '-created_at'
 
     def get_queryset(self):
         return Notification.objects.filter(user=self.request.user)
 
+    def get_archive_queryset(self):
+        return ArchivedNotification.objects.filter(user=self.request.user)
+
     @action(detail=False, methods=['get'])
     def unread_count(self, request):
         """Get count of unread notifications"""
@@ -36,7 +44,7 @@ class NotificationViewSet(viewsets.ModelViewSet):
         Notification.objects.filter(
             user=request.user,
             is_read=False
-        ).update(is_read=True)
+        ).update(is_read=True, updated_at=timezone.now())
         return Response({'status': 'all marked as read'})
 
 
@@ -0,0 +1,24 @@
+from django.contrib import admin
+from .models import Tombstone
+from users.admin_mixins import LargeTableAdminMixin
+
+
+class TombstoneModelFilter(admin.SimpleListFilter):
+    """Fixed choices; the default filter would read the values with a DISTINCT over the table"""
+    title = 'Modell'
+    parameter_name = 'model'
+
+    def lookups(self, request, model_admin):
+        return [(name, name) for name in ('offers', 'inquiries', 'chat_rooms', 'messages', 'notifications')]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(model=self.value())
+        return queryset
+
+
+@admin.register(Tombstone)
+class TombstoneAdmin(LargeTableAdminMixin, admin.ModelAdmin):
+    list_display = ('id', 'model', 'object_id', 'user', 'deleted_at')
+    list_select_related = ('user',)
+    list_filter = (TombstoneModelFilter, ('deleted_at', admin.DateFieldListFilter))
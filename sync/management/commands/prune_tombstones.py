@@ -0,0 +1,16 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from sync.models import Tombstone
+
+
+class Command(BaseCommand):
+    help = "Löscht Tombstones, die älter als SYNC_TOMBSTONE_RETENTION_DAYS sind."
+
+    def handle(self, *args, **options):
+        days = getattr(settings, 'SYNC_TOMBSTONE_RETENTION_DAYS', 30)
+        deleted, _ = Tombstone.objects.filter(deleted_at__lt=timezone.now() - timedelta(days=days)).delete()
+        self.stdout.write(self.style.SUCCESS(f"{deleted} Tombstones gelöscht."))
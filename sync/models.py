@@ -0,0 +1,29 @@
+from django.db import models
+from django.conf import settings
+
+
+class Tombstone(models.Model):
+    """
+    Marker for a deleted row so delta sync clients can drop it locally.
+    user=None means the deletion is visible to everyone (e.g. public offers).
+    No database constraint on user: tombstones are written from post_delete
+    while a user and their rows are being deleted in the same transaction.
+    """
+    model = models.CharField(max_length=50)
+    object_id = models.BigIntegerField()
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        blank=True,
+        related_name='tombstones'
+    )
+    deleted_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        ordering = ['deleted_at']
+        indexes = [models.Index(fields=['user', 'deleted_at'])]
+
+    def __str__(self):
+        return f"{self.model} #{self.object_id} gelöscht"
@@ -0,0 +1,58 @@
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from chat.models import ChatRoom, Message
+from jobs.models import Offer, Inquiry
+from notifications.models import Notification
+from users.models import User
+from .models import Tombstone
+
+
+def _deleted_user_ids(origin):
+    """Users removed by the delete() that cascaded here; they need no tombstones"""
+    if isinstance(origin, User):
+        return {origin.pk}
+    if isinstance(origin, QuerySet) and origin.model is User:
+        return set(origin.values_list('pk', flat=True))
+    return set()
+
+
+def _record(model, object_id, user_ids, origin=None):
+    user_ids = set(user_ids) - _deleted_user_ids(origin)
+    Tombstone.objects.bulk_create([
+        Tombstone(model=model, object_id=object_id, user_id=user_id) for user_id in user_ids
+    ])
+
+
+@receiver(post_delete, sender=User)
+def user_deleted(sender, instance, **kwargs):
+    Tombstone.objects.filter(user_id=instance.pk).delete()
+
+
+@receiver(post_delete, sender=Offer)
+def offer_deleted(sender, instance, origin=None, **kwargs):
+    # Offene Angebote sind für alle Kunden sichtbar -> öffentlicher Tombstone
+    _record('offers', instance.pk, [None], origin)
+
+
+@receiver(post_delete, sender=Inquiry)
+def inquiry_deleted(sender, instance, origin=None, **kwargs):
+    craftsman_ids = Offer.objects.filter(pk=instance.offer_id).values_list('craftsman_id', flat=True)
+    _record('inquiries', instance.pk, [instance.customer_id, *craftsman_ids], origin)
+
+
+@receiver(post_delete, sender=ChatRoom)
+def chat_room_deleted(sender, instance, origin=None, **kwargs):
+    _record('chat_rooms', instance.pk, [instance.customer_id, instance.craftsman_id], origin)
+
+
+@receiver(post_delete, sender=Message)
+def message_deleted(sender, instance, origin=None, **kwargs):
+    participants = ChatRoom.objects.filter(pk=instance.chat_room_id).values_list('customer_id', 'craftsman_id')
+    _record('messages', instance.pk, [user_id for pair in participants for user_id in pair], origin)
+
+
+@receiver(post_delete, sender=Notification)
+def notification_deleted(sender, instance, origin=None, **kwargs):
+    _record('notifications', instance.pk, [instance.user_id], origin)
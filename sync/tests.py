@@ -0,0 +1,67 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from chat.models import ChatRoom, Message
+from jobs.models import Offer, Inquiry
+from notifications.models import Notification
+from users.models import User
+from .models import Tombstone
+from .tokens import decode_token, encode_token, from_micros, to_micros
+
+
+class SyncTokenTests(TestCase):
+    def test_round_trip(self):
+        now = timezone.now()
+        state = decode_token(encode_token({'s': to_micros(now)}))
+        self.assertEqual(from_micros(state['s']), now)
+
+    def test_malformed_tokens_raise_value_error(self):
+        for token in ('%%%', encode_token([1, 2]), encode_token({'s': 10 ** 30}), encode_token({'p': {'offers': 'x'}})):
+            with self.subTest(token=token):
+                with self.assertRaises(ValueError):
+                    decode_token(token)
+
+
+class TombstoneTests(TestCase):
+    def setUp(self):
+        self.craftsman = User.objects.create_user('handwerker@example.com', 'pw', role=User.Role.CRAFTSMAN)
+
+    def test_deleted_offer_leaves_public_tombstone(self):
+        offer = Offer.objects.create(craftsman=self.craftsman, title='Dach', description='-', trade='Dachdecker', zip_code='20095')
+        offer_id = offer.pk
+        offer.delete()
+        self.assertTrue(Tombstone.objects.filter(model='offers', object_id=offer_id, user__isnull=True).exists())
+
+    def test_user_with_notifications_can_be_deleted(self):
+        Notification.objects.create(user=self.craftsman, notification_type='MESSAGE', title='Hallo', message='-')
+        user_id = self.craftsman.pk
+        self.craftsman.delete()
+        connection.check_constraints()
+        self.assertFalse(Tombstone.objects.filter(user_id=user_id).exists())
+
+    def test_deleting_a_user_leaves_tombstones_for_the_other_side(self):
+        customer = User.objects.create_user('kunde@example.com', 'pw', role=User.Role.CUSTOMER)
+        offer = Offer.objects.create(craftsman=self.craftsman, title='Dach', description='-', trade='Dachdecker', zip_code='20095')
+        inquiry = Inquiry.objects.create(offer=offer, customer=customer)
+        room = ChatRoom.objects.create(job=offer, customer=customer, craftsman=self.craftsman)
+        Message.objects.create(chat_room=room, sender=customer, content='Hallo')
+        craftsman_id = self.craftsman.pk
+
+        User.objects.filter(pk=craftsman_id).delete()
+        connection.check_constraints()
+        self.assertFalse(Tombstone.objects.filter(user_id=craftsman_id).exists())
+        self.assertTrue(Tombstone.objects.filter(model='inquiries', object_id=inquiry.pk, user=customer).exists())
+        self.assertTrue(Tombstone.objects.filter(model='chat_rooms', object_id=room.pk, user=customer).exists())
+
+    @override_settings(SYNC_TOMBSTONE_RETENTION_DAYS=30)
+    def test_prune_removes_expired_tombstones(self):
+        old = Tombstone.objects.create(model='offers', object_id=1)
+        Tombstone.objects.filter(pk=old.pk).update(deleted_at=timezone.now() - timedelta(days=31))
+        fresh = Tombstone.objects.create(model='offers', object_id=2)
+        call_command('prune_tombstones', stdout=StringIO())
+        self.assertEqual(list(Tombstone.objects.values_list('pk', flat=True)), [fresh.pk])
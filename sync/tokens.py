@@ -0,0 +1,47 @@
+import base64
+import binascii
+import json
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+def to_micros(moment):
+    return (moment - EPOCH) // timedelta(microseconds=1)
+
+
+def from_micros(micros):
+    """Raises ValueError for anything that is not a representable timestamp"""
+    try:
+        return EPOCH + timedelta(microseconds=int(micros))
+    except (TypeError, OverflowError, OSError) as exc:
+        raise ValueError(str(exc)) from exc
+
+
+def encode_token(state):
+    raw = json.dumps(state, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_token(token):
+    """
+    Decode an opaque sync token into its state dict:
+    {'s': lower bound (micros) or None, 'n': upper watermark, 'p': {model: cursor}}
+    Raises ValueError for malformed tokens.
+    """
+    try:
+        state = json.loads(base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError('invalid token') from exc
+    if not isinstance(state, dict) or not isinstance(state.get('p', {}), dict):
+        raise ValueError('invalid token')
+    for key in ('s', 'n'):
+        if state.get(key) is not None:
+            from_micros(state[key])
+    for cursor in state.get('p', {}).values():
+        if cursor is not None:
+            if not isinstance(cursor, list) or len(cursor) != 2:
+                raise ValueError('invalid cursor')
+            from_micros(cursor[0])
+            int(cursor[1])
+    return state
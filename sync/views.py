@@ -0,0 +1,145 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from archive.models import ArchivedInquiry
+from chat.models import ChatRoom, Message
+from chat.serializers import ChatRoomSerializer, MessageSerializer
+from jobs.models import Offer, Inquiry
+from jobs.serializers import OfferSerializer, InquirySerializer
+from notifications.models import Notification
+from notifications.serializers import NotificationSerializer
+from users.models import User
+from .models import Tombstone
+from .tokens import decode_token, encode_token, from_micros, to_micros
+
+# Überlappung, damit Zeilen aus noch laufenden Transaktionen nicht verloren gehen
+SYNC_OVERLAP = timedelta(seconds=2)
+TOMBSTONES = 'tombstones'
+
+
+def visible_querysets(user, delta):
+    """
+    Rows the user may see, mirroring the list endpoints of each app.
+    In delta mode customers get all changed offers; the view splits them into
+    visible rows and removals (e.g. an offer that left OPEN).
+    """
+    rooms = ChatRoom.objects.filter(Q(customer=user) | Q(craftsman=user))
+    if user.role == User.Role.CRAFTSMAN:
+        offers = Offer.objects.filter(craftsman=user)
+        inquiries = Inquiry.objects.filter(offer__craftsman=user)
+    else:
+        offers = Offer.objects.annotate(
+            has_inquiry=Exists(Inquiry.objects.filter(offer=OuterRef('pk'), customer=user)),
+            has_archived_inquiry=Exists(ArchivedInquiry.objects.filter(offer=OuterRef('pk'), customer=user)),
+        )
+        if not delta:
+            # Kunden sehen offene Angebote und solche, für die sie angefragt haben
+            offers = offers.filter(
+                Q(status=Offer.JobStatus.OPEN) | Q(has_inquiry=True) | Q(has_archived_inquiry=True)
+            )
+        inquiries = Inquiry.objects.filter(customer=user)
+    return {
+        'offers': (offers, OfferSerializer),
+        'inquiries': (inquiries, InquirySerializer),
+        'chat_rooms': (rooms.select_related('job', 'customer', 'craftsman'), ChatRoomSerializer),
+        'messages': (
+            Message.objects.filter(Q(chat_room__customer=user) | Q(chat_room__craftsman=user)).select_related('sender', 'chat_room'),
+            MessageSerializer,
+        ),
+        'notifications': (Notification.objects.filter(user=user), NotificationSerializer),
+    }
+
+
+def _page(queryset, field, since, upper, cursor, limit):
+    """One keyset page ordered by (field, id); returns rows and the next cursor or None"""
+    queryset = queryset.filter(**{f'{field}__lt': upper})
+    if since:
+        queryset = queryset.filter(**{f'{field}__gte': since})
+    if cursor:
+        moment, last_id = from_micros(cursor[0]), cursor[1]
+        queryset = queryset.filter(Q(**{f'{field}__gt': moment}) | Q(**{field: moment, 'id__gt': last_id}))
+    rows = list(queryset.order_by(field, 'id')[:limit + 1])
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, [to_micros(getattr(rows[-1], field)), rows[-1].id]
+
+
+class SyncView(APIView):
+    """
+    Delta sync for mobile clients
+    GET /api/sync/?since=<token>
+    Without `since` all visible rows are returned. Each model is paged
+    (SYNC_PAGE_SIZE); while `has_more` is true the client calls again with the
+    returned `token`, afterwards the token is the watermark for the next delta.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        state = {}
+        if request.query_params.get('since'):
+            try:
+                state = decode_token(request.query_params['since'])
+            except ValueError:
+                return Response({'error': 'Ungültiger since-Token.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        now = timezone.now()
+        since = from_micros(state['s']) if state.get('s') is not None else None
+        retention = timedelta(days=getattr(settings, 'SYNC_TOMBSTONE_RETENTION_DAYS', 30))
+        if since and 'p' not in state and since < now - retention:
+            # Tombstones sind bereits bereinigt -> vollständige Neusynchronisation
+            since = None
+        upper = from_micros(state['n']) if state.get('n') is not None else now
+        querysets = visible_querysets(request.user, delta=since is not None)
+        names = list(querysets) + ([TOMBSTONES] if since else [])
+        pending = state.get('p', {name: None for name in names})
+        limit = getattr(settings, 'SYNC_PAGE_SIZE', 500)
+
+        changes = {name: [] for name in querysets}
+        deleted = {name: [] for name in querysets}
+        next_pending = {}
+        context = {'request': request}
+        for name in names:
+            if name not in pending:
+                continue
+            if name == TOMBSTONES:
+                tombstones = Tombstone.objects.filter(Q(user=request.user) | Q(user__isnull=True))
+                rows, cursor = _page(tombstones, 'deleted_at', since, upper, pending[name], limit)
+                for tombstone in rows:
+                    deleted.setdefault(tombstone.model, []).append(tombstone.object_id)
+            else:
+                queryset, serializer_class = querysets[name]
+                rows, cursor = _page(queryset, 'updated_at', since, upper, pending[name], limit)
+                if name == 'offers' and since and request.user.role != User.Role.CRAFTSMAN:
+                    # Angebote, die OPEN verlassen haben, verschwinden für unbeteiligte Kunden
+                    visible = [
+                        o for o in rows
+                        if o.status == Offer.JobStatus.OPEN or o.has_inquiry or o.has_archived_inquiry
+                    ]
+                    visible_ids = {o.pk for o in visible}
+                    deleted[name].extend(o.pk for o in rows if o.pk not in visible_ids)
+                    rows = visible
+                serializer = serializer_class(rows, many=True, context=context)
+                # Nachrichten werden separat synchronisiert
+                serializer.child.fields.pop('messages', None)
+                changes[name] = serializer.data
+            if cursor:
+                next_pending[name] = cursor
+
+        if next_pending:
+            token = {'s': to_micros(since) if since else None, 'n': to_micros(upper), 'p': next_pending}
+        else:
+            token = {'s': to_micros(upper - SYNC_OVERLAP)}
+        return Response({
+            'token': encode_token(token),
+            'has_more': bool(next_pending),
+            'full': since is None,
+            'changes': changes,
+            'deleted': deleted,
+        })
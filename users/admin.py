@@ -1,6 +1,26 @@
 from django.contrib import admin
 from .models import User, CustomerProfile, CraftsmanProfile
 
-admin.site.register(User)
-admin.site.register(CustomerProfile)
-admin.site.register(CraftsmanProfile)
+
+@admin.register(User)
+class UserAdmin(admin.ModelAdmin):
+    list_display = ('email', 'first_name', 'last_name', 'role', 'is_active')
+    list_filter = ('role', 'is_active')
+    search_fields = ('email', 'first_name', 'last_name')
+    ordering = ('email',)
+
+
+@admin.register(CustomerProfile)
+class CustomerProfileAdmin(admin.ModelAdmin):
+    list_select_related = ('user',)
+    search_fields = ('user__email',)
+    autocomplete_fields = ('user',)
+
+
+@admin.register(CraftsmanProfile)
+class CraftsmanProfileAdmin(admin.ModelAdmin):
+    list_display = ('user', 'company_name', 'trade', 'is_verified')
+    list_select_related = ('user',)
+    list_filter = ('is_verified',)
+    search_fields = ('user__email', 'company_name')
+    autocomplete_fields = ('user',)
@@ -0,0 +1,80 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+# Unterhalb dieser Größe wird exakt gezählt; gefilterte Zählungen werden hier gekappt
+ESTIMATE_THRESHOLD = 10000
+
+
+def estimate_row_count(model, using='default'):
+    """Row count from table statistics instead of COUNT(*), None if unavailable"""
+    connection = connections[using]
+    table = model._meta.db_table
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE relname = %s", [table])
+        elif connection.vendor == 'mysql':
+            cursor.execute(
+                "SELECT table_rows FROM information_schema.tables "
+                "WHERE table_schema = DATABASE() AND table_name = %s",
+                [table],
+            )
+        elif connection.vendor == 'sqlite':
+            # MAX(rowid) ist ein einzelner B-Tree-Zugriff
+            cursor.execute(f'SELECT MAX(rowid) FROM "{table}"')
+        else:
+            return None
+        row = cursor.fetchone()
+    return int(row[0]) if row and row[0] is not None else None
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that uses the table statistics for unfiltered large tables and a
+    bounded COUNT over at most ESTIMATE_THRESHOLD rows for filtered ones
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not queryset.query.where:
+            estimate = estimate_row_count(queryset.model, queryset.db)
+            if estimate is not None and estimate > ESTIMATE_THRESHOLD:
+                return estimate
+            return super().count
+        return queryset.order_by()[:ESTIMATE_THRESHOLD].count()
+
+
+class LargeTableAdminMixin:
+    """
+    ModelAdmin mixin for tables with millions of rows: estimated counts,
+    no full-result count and keyset navigation via ?cursor=<pk>
+    (newest first), so deep pages never need a large OFFSET.
+    """
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    change_list_template = 'admin/cursor_change_list.html'
+    list_per_page = 50
+    ordering = ('-pk',)
+
+    def changelist_view(self, request, extra_context=None):
+        params = request.GET.copy()
+        cursor = params.pop('cursor', [None])[-1]
+        request.GET = params
+        request.admin_cursor = int(cursor) if cursor and cursor.isdigit() else None
+        navigation = params.copy()
+        navigation.pop('p', None)
+        extra_context = {
+            **(extra_context or {}),
+            'cursor_query': navigation.urlencode(),
+            # Keyset-Navigation nur bei Standardsortierung (neueste zuerst)
+            'cursor_enabled': 'o' not in navigation,
+        }
+        return super().changelist_view(request, extra_context=extra_context)
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        cursor = getattr(request, 'admin_cursor', None)
+        if cursor:
+            queryset = queryset.filter(pk__lt=cursor)
+        return queryset
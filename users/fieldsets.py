@@ -0,0 +1,97 @@
+from django.core.exceptions import FieldDoesNotExist
+
+
+def _split_param(value):
+    return {part.strip() for part in (value or '').split(',') if part.strip()}
+
+
+def _nested_lookups(prefix, field):
+    """Prefetch lookups for FKs a nested (many) serializer reads, e.g. messages__sender"""
+    child = getattr(field, 'child', field)
+    lookups = set()
+    for nested in getattr(child, 'fields', {}).values():
+        if nested.source != '*' and ('.' in nested.source or hasattr(nested, 'fields')):
+            lookups.add(f"{prefix}__{nested.source.split('.')[0]}")
+    return sorted(lookups)
+
+
+class SparseFieldsetMixin:
+    """
+    ViewSet mixin for ?fields=a,b and ?expand=c on read requests.
+
+    `fields` drops all other serializer fields and narrows the query with
+    only(); names in `expandable_fields` are left out unless requested via
+    `expand` (or named in `fields`), which then adds the matching
+    select_related/prefetch_related. Kept many-to-many and reverse relations
+    are always prefetched.
+    """
+    expandable_fields = ()
+
+    def _requested_fields(self):
+        if self.request is None or self.request.method not in ('GET', 'HEAD'):
+            return None, None
+        params = self.request.query_params
+        fields, expand = _split_param(params.get('fields')) or None, _split_param(params.get('expand'))
+        # ?fields=messages ohne expand soll die Nachrichten liefern, nicht ein leeres Objekt
+        return fields, expand | (set(fields or ()) & set(self.expandable_fields))
+
+    def _kept_field_names(self, all_names):
+        fields, expand = self._requested_fields()
+        if fields is None and expand is None:
+            return None
+        kept = set(all_names) - (set(self.expandable_fields) - expand)
+        if fields:
+            kept &= fields | expand
+        return kept
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        target = getattr(serializer, 'child', serializer)
+        kept = self._kept_field_names(target.fields.keys())
+        if kept is not None:
+            for name in list(target.fields.keys()):
+                if name not in kept:
+                    target.fields.pop(name)
+        return serializer
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        fields, expand = self._requested_fields()
+        if fields is None and not expand:
+            return queryset
+
+        model = queryset.model
+        serializer_fields = self.get_serializer_class()(context=self.get_serializer_context()).fields
+        kept = self._kept_field_names(serializer_fields.keys())
+
+        only = {model._meta.pk.name}
+        narrowable = True
+        for name in kept:
+            source = serializer_fields[name].source
+            try:
+                model_field = model._meta.get_field(source.split('.')[0])
+            except FieldDoesNotExist:
+                # Berechnete Felder (z.B. SerializerMethodField) -> kein only()
+                narrowable = False
+                continue
+            forward = model_field.many_to_one or (model_field.one_to_one and model_field.concrete)
+            if forward and (name in expand or '.' in source):
+                queryset = queryset.select_related(model_field.name)
+            elif model_field.is_relation and not forward:
+                queryset = queryset.prefetch_related(
+                    model_field.name, *_nested_lookups(model_field.name, serializer_fields[name]),
+                )
+            if model_field.concrete:
+                only.add(model_field.name)
+            elif not model_field.is_relation:
+                narrowable = False
+
+        select_related = queryset.query.select_related
+        if select_related is True:
+            narrowable = False
+        elif select_related:
+            # select_related-Felder dürfen nicht zurückgestellt werden
+            only.update(select_related.keys())
+        if fields and narrowable:
+            queryset = queryset.only(*only)
+        return queryset
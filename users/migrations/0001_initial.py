@@ -0,0 +1,63 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:27
+
+import django.db.models.deletion
+import django.utils.timezone
+import users.models
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='User',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('password', models.CharField(max_length=128, verbose_name='password')),
+                ('last_login', models.DateTimeField(blank=True, null=True, verbose_name='last login')),
+                ('is_superuser', models.BooleanField(default=False, help_text='Designates that this user has all permissions without explicitly assigning them.', verbose_name='superuser status')),
+                ('first_name', models.CharField(blank=True, max_length=150, verbose_name='first name')),
+                ('last_name', models.CharField(blank=True, max_length=150, verbose_name='last name')),
+                ('is_staff', models.BooleanField(default=False, help_text='Designates whether the user can log into this admin site.', verbose_name='staff status')),
+                ('is_active', models.BooleanField(default=True, help_text='Designates whether this user should be treated as active. Unselect this instead of deleting accounts.', verbose_name='active')),
+                ('date_joined', models.DateTimeField(default=django.utils.timezone.now, verbose_name='date joined')),
+                ('email', models.EmailField(max_length=254, unique=True, verbose_name='E-Mail-Adresse')),
+                ('role', models.CharField(choices=[('CUSTOMER', 'Kunde'), ('CRAFTSMAN', 'Handwerker'), ('ADMIN', 'Administrator')], default='CUSTOMER', max_length=50, verbose_name='Benutzerrolle')),
+                ('groups', models.ManyToManyField(blank=True, help_text='The groups this user belongs to. A user will get all permissions granted to each of their groups.', related_name='user_set', related_query_name='user', to='auth.group', verbose_name='groups')),
+                ('user_permissions', models.ManyToManyField(blank=True, help_text='Specific permissions for this user.', related_name='user_set', related_query_name='user', to='auth.permission', verbose_name='user permissions')),
+            ],
+            options={
+                'verbose_name': 'user',
+                'verbose_name_plural': 'users',
+                'abstract': False,
+            },
+            managers=[
+                ('objects', users.models.CustomUserManager()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='CraftsmanProfile',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='craftsman_profile', serialize=False, to=settings.AUTH_USER_MODEL, verbose_name='Benutzer')),
+                ('company_name', models.CharField(blank=True, max_length=255, verbose_name='Firmenname')),
+                ('trade', models.CharField(blank=True, max_length=100, verbose_name='Gewerbe')),
+                ('service_area_zip', models.CharField(blank=True, max_length=50, verbose_name='PLZ-Einsatzgebiet')),
+                ('is_verified', models.BooleanField(default=False, verbose_name='Verifiziert')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='CustomerProfile',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='customer_profile', serialize=False, to=settings.AUTH_USER_MODEL, verbose_name='Benutzer')),
+                ('phone_number', models.CharField(blank=True, max_length=20, verbose_name='Telefonnummer')),
+                ('address', models.TextField(blank=True, verbose_name='Adresse')),
+            ],
+        ),
+    ]
@@ -1,3 +1,113 @@
-from django.test import TestCase
+from django.contrib import admin
+from django.contrib.auth.models import Group
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import path
+from rest_framework import serializers, viewsets
+from rest_framework.test import APIRequestFactory, force_authenticate
 
-# Create your tests here.
+from chat.models import ChatRoom, Message
+from jobs.models import Offer
+from users.models import User
+from .fieldsets import SparseFieldsetMixin
+
+urlpatterns = [
+    path('admin/', admin.site.urls),
+]
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class LargeTableAdminTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser('admin@example.com', 'pw')
+        self.client.force_login(self.admin)
+
+    def test_changelists_skip_table_scans(self):
+        for url in ('/admin/chat/message/', '/admin/notifications/notification/', '/admin/sync/tombstone/',
+                    '/admin/archive/archivedmessage/', '/admin/archive/archivednotification/'):
+            with self.subTest(url=url), CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                # date_hierarchy und Wertefilter lesen per DISTINCT die ganze Tabelle
+                self.assertFalse([q['sql'] for q in queries if 'DISTINCT' in q['sql']])
+
+
+class ChatMessageSerializer(serializers.ModelSerializer):
+    sender = serializers.CharField(source='sender.email')
+
+    class Meta:
+        model = Message
+        fields = ['id', 'sender', 'content']
+
+
+class ChatRoomSerializer(serializers.ModelSerializer):
+    messages = ChatMessageSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = ChatRoom
+        fields = ['id', 'job', 'customer', 'craftsman', 'messages']
+
+
+class ChatRoomViewSet(SparseFieldsetMixin, viewsets.ReadOnlyModelViewSet):
+    serializer_class = ChatRoomSerializer
+    expandable_fields = ('messages',)
+    queryset = ChatRoom.objects.order_by('pk')
+
+
+class GroupUserSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = User
+        fields = ['id', 'email', 'role', 'groups']
+
+
+class GroupUserViewSet(SparseFieldsetMixin, viewsets.ReadOnlyModelViewSet):
+    serializer_class = GroupUserSerializer
+    queryset = User.objects.order_by('pk')
+
+
+class SparseFieldsetTests(TestCase):
+    def setUp(self):
+        self.craftsman = User.objects.create_user('felder-h@example.com', 'pw', role=User.Role.CRAFTSMAN)
+        group = Group.objects.create(name='Kunden')
+        offer = Offer.objects.create(craftsman=self.craftsman, title='Bad', description='-', trade='Fliesenleger', zip_code='10115')
+        for i in range(3):
+            customer = User.objects.create_user(f'felder-{i}@example.com', 'pw', role=User.Role.CUSTOMER)
+            customer.groups.add(group)
+            room = ChatRoom.objects.create(job=offer, customer=customer, craftsman=self.craftsman)
+            for sender in (customer, self.craftsman):
+                Message.objects.create(chat_room=room, sender=sender, content='Hallo')
+
+    def get(self, viewset, **params):
+        request = APIRequestFactory().get('/', params)
+        force_authenticate(request, user=self.craftsman)
+        response = viewset.as_view({'get': 'list'})(request)
+        response.render()
+        return response.data
+
+    def test_fields_narrow_the_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            data = self.get(GroupUserViewSet, fields='id,email')
+        self.assertEqual(set(data[0]), {'id', 'email'})
+        self.assertNotIn('password', queries[-1]['sql'])
+
+    def test_many_to_many_fields_are_prefetched(self):
+        with self.assertNumQueries(2):
+            data = self.get(GroupUserViewSet, fields='id,groups')
+        self.assertEqual(len(data), 4)
+
+    def test_expandable_fields_are_hidden_by_default(self):
+        with self.assertNumQueries(1):
+            data = self.get(ChatRoomViewSet, fields='id,customer')
+        self.assertEqual(set(data[0]), {'id', 'customer'})
+
+    def test_expand_prefetches_nested_relations(self):
+        # Räume, Nachrichten, Absender
+        with self.assertNumQueries(3):
+            data = self.get(ChatRoomViewSet, expand='messages')
+        self.assertEqual(len(data[0]['messages']), 2)
+
+    def test_fields_can_name_expandable_fields(self):
+        data = self.get(ChatRoomViewSet, fields='id,messages')
+        self.assertEqual(set(data[0]), {'id', 'messages'})
+        self.assertEqual(len(data[0]['messages']), 2)
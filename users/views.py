@@ -14,6 +14,7 @@ from .serializers import (
     RegisterSerializer,
 )
 from .permissions import IsOwnerOrReadOnly, IsCustomer, IsCraftsman
+from .fieldsets import SparseFieldsetMixin
 
 
 class RegisterView(generics.CreateAPIView):
@@ -55,7 +56,7 @@ class LogoutView(APIView):
             return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-class UserViewSet(viewsets.ReadOnlyModelViewSet):
+class UserViewSet(SparseFieldsetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = User.objects.all().order_by('-date_joined')
     serializer_class = UserSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -66,13 +67,13 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
         return Response(serializer.data)
 
 
-class CustomerProfileViewSet(viewsets.ModelViewSet):
+class CustomerProfileViewSet(SparseFieldsetMixin, viewsets.ModelViewSet):
     queryset = CustomerProfile.objects.all()
     serializer_class = CustomerProfileSerializer
     permission_classes = [permissions.IsAuthenticated, IsOwnerOrReadOnly]
 
 
-class CraftsmanProfileViewSet(viewsets.ModelViewSet):
+class CraftsmanProfileViewSet(SparseFieldsetMixin, viewsets.ModelViewSet):
     queryset = CraftsmanProfile.objects.all()
     serializer_class = CraftsmanProfileSerializer
     permission_classes = [permissions.IsAuthenticated, IsOwnerOrReadOnly]